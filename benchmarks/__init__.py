@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+"""Reproducible benchmarks for the Eidos SDK™ hot paths. Run with ``python -m benchmarks``."""
@@ -0,0 +1,40 @@
+# benchmarks/bench_autonomy.py
+
+import random
+from array import array
+
+from eidos.core.recursive_autonomy import FleetAutonomyPipeline
+
+SIZES = {"quick": [1000, 10000], "full": [1000, 10000, 50000]}
+
+
+def _fleet_columns(size: int):
+    agent_ids = [f"agent-{i}" for i in range(size)]
+    performance = array('d', (random.uniform(0.5, 1.0) for _ in range(size)))
+    alignment = array('d', (random.uniform(0.7, 1.0) for _ in range(size)))
+    return agent_ids, performance, alignment
+
+
+def fleet(size: int):
+    agent_ids, performance, alignment = _fleet_columns(size)
+
+    def setup():
+        return FleetAutonomyPipeline(seed=0)
+    return setup, (lambda pipeline: pipeline.run(agent_ids, performance, alignment))
+
+
+def fleet_pooled(size: int):
+    """Per-tick cost with a warm worker pool (pool startup happens in setup)."""
+    agent_ids, performance, alignment = _fleet_columns(size)
+
+    def setup():
+        pipeline = FleetAutonomyPipeline(seed=0, workers=2, chunk_size=max(1, size // 4))
+        pipeline.run(agent_ids, performance, alignment)
+        return pipeline
+    return setup, (lambda pipeline: pipeline.run(agent_ids, performance, alignment)), (lambda pipeline: pipeline.close())
+
+
+BENCHMARKS = {
+    "autonomy.fleet_pipeline": (fleet, SIZES),
+    "autonomy.fleet_pipeline_pooled": (fleet_pooled, SIZES),
+}
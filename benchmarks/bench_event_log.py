@@ -0,0 +1,76 @@
+# benchmarks/bench_event_log.py
+
+import os
+import random
+import tempfile
+import time
+
+from eidos.core.agent_spawner import AgentSpawner
+from eidos.core.event_log import EventLog, replay
+from eidos.core.memetic_kernel import MemeticKernel
+from eidos.protocol.swarm_protocol import SwarmProtocol
+
+# Sizes are memes ingested by the recorded workload.
+SIZES = {"quick": [1000, 10000], "full": [1000, 10000, 100000]}
+
+EVOLVE_STEPS = 20
+AGENTS = 100
+BELIEFS = ["decision_alpha", "decision_beta"]
+
+
+def _workload(size: int, log: EventLog):
+    """A representative run: ingest, evolution, spawning, belief updates and consensus."""
+    kernel = MemeticKernel()
+    spawner = AgentSpawner(parent_kernel=kernel)
+    log.attach(kernel)
+    log.attach(spawner)
+    for i in range(size):
+        kernel.ingest(f"idea {i}", initial_fitness=random.uniform(0.06, 1.0))
+    for _ in range(EVOLVE_STEPS):
+        kernel.evolve_step()
+    agents = [spawner.spawn_agent(name=f"Bench-{i}") for i in range(AGENTS)]
+    for agent in agents:
+        agent.update_belief(random.choices(BELIEFS, weights=[3, 1])[0])
+    swarm = SwarmProtocol("bench-swarm", agents)
+    log.attach(swarm)
+    swarm.achieve_consensus("bench-topic")
+
+
+def _temporary_path() -> str:
+    handle, path = tempfile.mkstemp(suffix=".eidoslog")
+    os.close(handle)
+    os.remove(path)
+    return path
+
+
+def logged_run(size: int):
+    """Times the workload itself with an event log attached."""
+    def run(path):
+        with EventLog(path) as log:
+            _workload(size, log)
+    return _temporary_path, run, os.remove
+
+
+def replay_log(size: int):
+    """Times rebuilding state from the workload's log and compares it to the original run."""
+    def setup():
+        path = _temporary_path()
+        start = time.perf_counter()
+        with EventLog(path) as log:
+            _workload(size, log)
+        return path, time.perf_counter() - start
+
+    def run(state):
+        path, original_seconds = state
+        start = time.perf_counter()
+        replay(path)
+        replay_seconds = time.perf_counter() - start
+        return {"original_seconds": original_seconds, "speedup": original_seconds / replay_seconds}
+
+    return setup, run, (lambda state: os.remove(state[0]))
+
+
+BENCHMARKS = {
+    "event_log.logged_run": (logged_run, SIZES),
+    "event_log.replay": (replay_log, SIZES),
+}
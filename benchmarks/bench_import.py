@@ -0,0 +1,63 @@
+# benchmarks/bench_import.py
+
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+# Upper bound for a bare ``import eidos`` in a fresh interpreter.
+IMPORT_BUDGET_MS = 10.0
+
+# Each snippet is timed inside a fresh interpreter so interpreter startup is excluded.
+SNIPPETS = {
+    "import.eidos": "import eidos",
+    "import.swarm_protocol": "import eidos.protocol.swarm_protocol",
+    "import.eidos_first_objects": (
+        "import eidos\n"
+        "kernel = eidos.MemeticKernel()\n"
+        "agent = eidos.AgentSpawner(parent_kernel=kernel).spawn_agent(name='first')\n"
+        "eidos.SwarmProtocol('first-swarm', [agent])"
+    ),
+}
+
+# The checkout this suite belongs to, so the child times it regardless of the working directory.
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_CHILD_TEMPLATE = """
+import os, sys, time
+sys.stdout = open(os.devnull, "w")
+start = time.perf_counter()
+exec(compile({snippet!r}, "<bench>", "exec"))
+elapsed = time.perf_counter() - start
+sys.stdout = sys.__stdout__
+print(elapsed)
+"""
+
+
+def time_snippet(snippet: str) -> float:
+    """Runs ``snippet`` in a fresh interpreter and returns how long it took, in seconds."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [_REPO_ROOT, env.get("PYTHONPATH")]))
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD_TEMPLATE.format(snippet=snippet)],
+        check=True, capture_output=True, text=True, env=env
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def run(repeat: int, selected: List[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Times every import snippet ``repeat`` times, in the runner's result format."""
+    import statistics
+    results = {}
+    for name, snippet in SNIPPETS.items():
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        timings = [time_snippet(snippet) for _ in range(repeat)]
+        results[name] = {
+            "size": 1,
+            "repeat": repeat,
+            "min_seconds": min(timings),
+            "median_seconds": statistics.median(timings),
+            "items_per_second": None
+        }
+    return results
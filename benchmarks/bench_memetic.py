@@ -0,0 +1,48 @@
+# benchmarks/bench_memetic.py
+
+import random
+
+from eidos.core.memetic_kernel import MemeticKernel, MemeUnit
+
+SIZES = {"quick": [1000, 10000], "full": [1000, 10000, 100000, 1000000]}
+
+TOPICS = ["alignment", "swarm", "energy", "habitat", "consensus", "memory", "vision", "ethics"]
+
+
+def _populated_kernel(size: int) -> MemeticKernel:
+    """Builds a kernel with ``size`` memes without going through ingest's logging."""
+    kernel = MemeticKernel()
+    kernel.meme_pool = [
+        MemeUnit(f"{random.choice(TOPICS)} note {i}", initial_fitness=random.uniform(0.06, 1.0))
+        for i in range(size)
+    ]
+    return kernel
+
+
+def ingest(size: int):
+    contents = [f"{random.choice(TOPICS)} note {i}" for i in range(size)]
+
+    def run(kernel):
+        for content in contents:
+            kernel.ingest(content)
+    return MemeticKernel, run
+
+
+def evolve(size: int):
+    return (lambda: _populated_kernel(size)), (lambda kernel: kernel.evolve_step())
+
+
+def retrieve_top(size: int):
+    return (lambda: _populated_kernel(size)), (lambda kernel: kernel.retrieve_memes(count=10))
+
+
+def retrieve_query(size: int):
+    return (lambda: _populated_kernel(size)), (lambda kernel: kernel.retrieve_memes(query="consensus", count=10))
+
+
+BENCHMARKS = {
+    "memetic.ingest": (ingest, SIZES),
+    "memetic.evolve_step": (evolve, SIZES),
+    "memetic.retrieve_top": (retrieve_top, SIZES),
+    "memetic.retrieve_query": (retrieve_query, SIZES),
+}
@@ -0,0 +1,39 @@
+# benchmarks/bench_neurostack.py
+
+from eidos.core.neurostack import Neurostack
+
+SIZES = {"quick": [1000], "full": [1000, 10000, 100000]}
+
+SENSORY_STREAM = {"visual": "Red blinking light.", "auditory": "High-pitched hum.", "tactile": "Slight vibration."}
+
+
+def _stack():
+    return Neurostack(agent_id="bench-agent")
+
+
+def process(size: int):
+    def run(stack):
+        for i in range(size):
+            stack.process_neural_activity(f"Raw sensory input {i}")
+    return _stack, run
+
+
+def cognition(size: int):
+    def run(stack):
+        for i in range(size):
+            stack.simulate_cognition("Evaluate threat level", complexity=0.7)
+    return _stack, run
+
+
+def sensory(size: int):
+    def run(stack):
+        for i in range(size):
+            stack.integrate_sensory_input(SENSORY_STREAM)
+    return _stack, run
+
+
+BENCHMARKS = {
+    "neurostack.process_neural_activity": (process, SIZES),
+    "neurostack.simulate_cognition": (cognition, SIZES),
+    "neurostack.integrate_sensory_input": (sensory, SIZES),
+}
@@ -0,0 +1,38 @@
+# benchmarks/bench_propagation.py
+
+import random
+
+from eidos.core.agent_spawner import Agent
+from eidos.core.memetic_kernel import MemeticKernel, MemeUnit
+from eidos.protocol.meme_propagation import MemePropagator
+from eidos.protocol.swarm_protocol import SwarmProtocol
+
+# Sizes are memes per kernel; a round's cost should stay flat as they grow.
+SIZES = {"quick": [1000, 10000], "full": [1000, 10000, 100000]}
+
+KERNELS = 20
+ROUNDS = 10
+
+
+def propagation_rounds(size: int):
+    def setup():
+        agents = [Agent(name=f"Bench-{i}") for i in range(KERNELS)]
+        kernels = {}
+        for agent in agents:
+            kernel = MemeticKernel()
+            kernel.meme_pool = [
+                MemeUnit(f"{agent.name} meme {i}", initial_fitness=random.uniform(0.06, 1.0)) for i in range(size)
+            ]
+            kernels[agent.id] = kernel
+        return MemePropagator(SwarmProtocol("bench-swarm", agents), kernels, seed=0)
+
+    def run(propagator):
+        for _ in range(ROUNDS):
+            propagator.propagate_round()
+        return {"memes_sent": propagator.memes_sent}
+    return setup, run
+
+
+BENCHMARKS = {
+    "propagation.rounds": (propagation_rounds, SIZES),
+}
@@ -0,0 +1,48 @@
+# benchmarks/bench_runtime.py
+
+import random
+import time
+
+from eidos.core.agent_spawner import Agent
+from eidos.protocol.swarm_runtime import DistributedSwarmProtocol
+
+# Sizes are worker process counts; the swarm itself is fixed.
+SIZES = {"quick": [1, 2], "full": [1, 2, 4, 8]}
+
+AGENTS = 2000
+MESSAGES = 500
+CONSENSUS_ROUNDS = 20
+BELIEFS = ["decision_alpha", "decision_beta"]
+
+
+def broadcast_and_consensus(size: int):
+    def setup():
+        agents = [Agent(name=f"Bench-{i}") for i in range(AGENTS)]
+        for agent in agents:
+            agent.local_belief = random.choices(BELIEFS, weights=[3, 1])[0]
+        return DistributedSwarmProtocol("bench-swarm", agents, workers=size)
+
+    def run(swarm):
+        sender_id = swarm.agents[0].id
+        start = time.perf_counter()
+        for i in range(MESSAGES):
+            swarm.broadcast_message(sender_id, "bench", i)
+        swarm.achieve_consensus("barrier") # Returns once every worker has drained its deliveries
+        broadcast_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(CONSENSUS_ROUNDS):
+            swarm.achieve_consensus("bench-topic")
+        consensus_seconds = (time.perf_counter() - start) / CONSENSUS_ROUNDS
+        return {
+            "messages_per_second": MESSAGES / broadcast_seconds,
+            "deliveries_per_second": MESSAGES * (AGENTS - 1) / broadcast_seconds,
+            "consensus_latency_seconds": consensus_seconds
+        }
+
+    return setup, run, (lambda swarm: swarm.close())
+
+
+BENCHMARKS = {
+    "runtime.broadcast_consensus": (broadcast_and_consensus, SIZES),
+}
@@ -0,0 +1,80 @@
+# benchmarks/bench_semantic.py
+
+import random
+
+from eidos.core.memetic_kernel import MemeUnit
+from eidos.core.semantic_index import SemanticMemeIndex
+
+SIZES = {"quick": [1000, 10000], "full": [1000, 10000, 100000]}
+
+QUERIES = 100
+TOP_K = 10
+VOCABULARY = [f"term{i}" for i in range(20000)]
+THEME_SIZE = 12
+
+
+def _themes(size: int):
+    # Memes are drawn around themes so that every query has a real neighborhood.
+    return [random.sample(VOCABULARY, THEME_SIZE) for _ in range(max(1, size // 50))]
+
+
+def _memes(size: int, themes):
+    return [
+        MemeUnit(" ".join(random.sample(random.choice(themes), 6) + random.sample(VOCABULARY, 2)),
+                 initial_fitness=random.uniform(0.06, 1.0))
+        for _ in range(size)
+    ]
+
+
+def _queries(themes):
+    return [" ".join(random.sample(random.choice(themes), 4)) for _ in range(QUERIES)]
+
+
+def index_add(size: int):
+    memes = _memes(size, _themes(size))
+
+    def run(index):
+        for meme in memes:
+            index.add(meme)
+    return SemanticMemeIndex, run
+
+
+def _search_case(size: int, exact: bool):
+    themes = _themes(size)
+    memes = _memes(size, themes)
+    queries = _queries(themes)
+    index = SemanticMemeIndex(exact_threshold=0) # Always use the ANN path for measurement
+    for meme in memes:
+        index.add(meme)
+    # Many memes tie on score, so (as in ann-benchmarks) a result counts as a true neighbor
+    # if it scores at least as well as the exact k-th result.
+    expected = [index.exact_search(query, TOP_K)[-1][0] - 1e-6 for query in queries]
+
+    def run(index):
+        search = index.exact_search if exact else index.search
+        hits = candidates = 0
+        for query, threshold in zip(queries, expected):
+            hits += sum(score >= threshold for score, _ in search(query, TOP_K))
+            candidates += index.last_candidate_count if not exact else len(index)
+        return {
+            "recall_at_10": hits / (TOP_K * QUERIES),
+            "queries": QUERIES,
+            "candidates_mean": candidates / QUERIES, # Memes scored per query
+            "candidate_fraction": candidates / QUERIES / max(1, len(index))
+        }
+    return (lambda: index), run
+
+
+def search(size: int):
+    return _search_case(size, exact=False)
+
+
+def exact_search(size: int):
+    return _search_case(size, exact=True)
+
+
+BENCHMARKS = {
+    "semantic.index_add": (index_add, SIZES),
+    "semantic.search": (search, SIZES),
+    "semantic.exact_search": (exact_search, SIZES),
+}
@@ -0,0 +1,55 @@
+# benchmarks/bench_swarm.py
+
+import random
+
+from eidos.core.agent_spawner import Agent, AgentSpawner
+from eidos.protocol.swarm_protocol import SwarmProtocol
+
+SIZES = {"quick": [100, 1000], "full": [100, 1000, 10000, 100000]}
+
+BELIEFS = ["decision_alpha", "decision_beta", "decision_gamma"]
+
+
+def _agents(size: int):
+    agents = [Agent(name=f"Bench-{i}", directives=["Participate in consensus"]) for i in range(size)]
+    for agent in agents:
+        agent.local_belief = random.choices(BELIEFS, weights=[6, 3, 1])[0]
+    return agents
+
+
+def spawn(size: int):
+    def run(spawner):
+        for i in range(size):
+            spawner.spawn_agent(name=f"Bench-{i}", directives=["Explore"])
+    return AgentSpawner, run
+
+
+def orchestrate(size: int):
+    return (lambda: (AgentSpawner(), _agents(size))), (lambda state: state[0].orchestrate_agents(state[1]))
+
+
+def consensus(size: int):
+    def setup():
+        return SwarmProtocol("bench-swarm", _agents(size))
+    return setup, (lambda swarm: swarm.achieve_consensus("bench-topic", method="majority_vote"))
+
+
+def broadcast(size: int):
+    def setup():
+        return SwarmProtocol("bench-swarm", _agents(size))
+    return setup, (lambda swarm: swarm.broadcast_message(swarm.agents[0].id, "bench", {"value": 1}))
+
+
+def synchronize(size: int):
+    def setup():
+        return SwarmProtocol("bench-swarm", _agents(size))
+    return setup, (lambda swarm: swarm.synchronize_agents("decision_alpha"))
+
+
+BENCHMARKS = {
+    "agents.spawn": (spawn, SIZES),
+    "agents.orchestrate": (orchestrate, SIZES),
+    "swarm.achieve_consensus": (consensus, SIZES),
+    "swarm.broadcast_message": (broadcast, SIZES),
+    "swarm.synchronize_agents": (synchronize, SIZES),
+}
@@ -0,0 +1,163 @@
+# benchmarks/runner.py
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+BENCHMARK_MODULES = [
+    "benchmarks.bench_memetic",
+    "benchmarks.bench_swarm",
+    "benchmarks.bench_neurostack",
+    "benchmarks.bench_autonomy",
+    "benchmarks.bench_semantic",
+    "benchmarks.bench_propagation",
+    "benchmarks.bench_runtime",
+    "benchmarks.bench_event_log",
+]
+
+
+def load_benchmarks() -> Dict[str, Tuple[Callable, Dict[str, List[int]]]]:
+    """Collects the ``BENCHMARKS`` tables from every benchmark module."""
+    import importlib
+    benchmarks = {}
+    for module_name in BENCHMARK_MODULES:
+        benchmarks.update(importlib.import_module(module_name).BENCHMARKS)
+    return benchmarks
+
+
+def run_case(factory: Callable, size: int, repeat: int, seed: int) -> Dict[str, Any]:
+    """
+    Times one benchmark case. Setup runs before every repetition and is not timed;
+    the SDK's console output is discarded so it does not depend on the terminal.
+    If the timed function returns a dict (e.g. a recall figure), it is merged into the result.
+    Factories may return an optional third callable that tears down each repetition's state.
+    """
+    timings = []
+    extra = None
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        random.seed(seed)
+        setup, run, *teardown = factory(size)
+        for _ in range(repeat):
+            random.seed(seed)
+            state = setup()
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                extra = run(state)
+                timings.append(time.perf_counter() - start)
+            finally:
+                gc.enable()
+                for cleanup in teardown:
+                    cleanup(state)
+    median = statistics.median(timings)
+    result = {
+        "size": size,
+        "repeat": repeat,
+        "min_seconds": min(timings),
+        "median_seconds": median,
+        "items_per_second": size / median if median else None
+    }
+    if isinstance(extra, dict):
+        result.update(extra)
+    return result
+
+
+def run_benchmarks(profile: str = "quick", repeat: int = 5, seed: int = 1234,
+                   selected: List[str] = None) -> Dict[str, Any]:
+    """Runs every benchmark (or those whose name contains one of ``selected``) for a size profile."""
+    results = {}
+    for name, (factory, sizes) in load_benchmarks().items():
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        for size in sizes[profile]:
+            key = f"{name}[{size}]"
+            results[key] = run_case(factory, size, repeat, seed)
+            print(f"{key:<50} median {results[key]['median_seconds'] * 1000:10.3f} ms", file=sys.stderr)
+
+    from benchmarks import bench_import
+    for key, result in bench_import.run(repeat, selected).items():
+        results[key] = result
+        print(f"{key:<50} median {result['median_seconds'] * 1000:10.3f} ms", file=sys.stderr)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "profile": profile,
+            "repeat": repeat,
+            "seed": seed
+        },
+        "results": results
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Compares best-of-N timings against a saved baseline (the minimum is the least noisy estimate).
+    Returns the names of cases that got slower by more than ``threshold`` (e.g. 0.10 = 10%).
+    """
+    regressions = []
+    for key, result in current["results"].items():
+        reference = baseline["results"].get(key)
+        if reference is None:
+            continue
+        change = result["min_seconds"] / reference["min_seconds"] - 1.0
+        status = "REGRESSION" if change > threshold else "ok"
+        print(f"{key:<50} {change * 100:+8.1f}%  {status}", file=sys.stderr)
+        if change > threshold:
+            regressions.append(key)
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Eidos SDK benchmark suite.")
+    parser.add_argument("--profile", choices=["quick", "full"], default="quick",
+                        help="Size profile: 'full' scales memes to 1e6 and agents to 1e5.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions per case.")
+    parser.add_argument("--seed", type=int, default=1234, help="Random seed used for setup and each run.")
+    parser.add_argument("--filter", action="append", dest="selected",
+                        help="Only run benchmarks whose name contains this text (repeatable).")
+    parser.add_argument("--output", help="Write results as JSON to this path (default: stdout).")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed slowdown before a case counts as a regression (default: 0.10).")
+    parser.add_argument("--import-budget-ms", type=float, default=None,
+                        help="Fail if a bare 'import eidos' takes longer than this (default: bench_import.IMPORT_BUDGET_MS).")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.profile, args.repeat, args.seed, args.selected)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    status = 0
+    if args.compare: # Report regressions even if the import budget check below fails
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed beyond {args.threshold:.0%}.", file=sys.stderr)
+            status = 1
+
+    from benchmarks.bench_import import IMPORT_BUDGET_MS
+    budget_ms = args.import_budget_ms if args.import_budget_ms is not None else IMPORT_BUDGET_MS
+    import_result = results["results"].get("import.eidos")
+    if import_result is not None and import_result["min_seconds"] * 1000 > budget_ms:
+        print(f"'import eidos' took {import_result['min_seconds'] * 1000:.2f} ms, over the {budget_ms:.2f} ms budget.",
+              file=sys.stderr)
+        status = 1
+    return status
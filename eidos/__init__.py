@@ -0,0 +1,67 @@
+# eidos/__init__.py
+"""
+Eidos SDK™: the foundational SDK for the Eidos Protocol™.
+
+Public classes are exposed here but loaded lazily, so ``import eidos`` stays cheap for
+short-lived worker processes; each submodule is imported the first time one of its names is used.
+"""
+
+__version__ = "0.0.1"
+
+# Public name -> module that defines it. This is the only copy: eidos.core and eidos.protocol
+# export the entries for their own modules.
+_LAZY_ATTRIBUTES = {
+    "MemeUnit": "eidos.core.memetic_kernel",
+    "MemeticKernel": "eidos.core.memetic_kernel",
+    "Agent": "eidos.core.agent_spawner",
+    "AgentSpawner": "eidos.core.agent_spawner",
+    "Neurostack": "eidos.core.neurostack",
+    "RecursiveAutonomyEngine": "eidos.core.recursive_autonomy",
+    "FleetAutonomyPipeline": "eidos.core.recursive_autonomy",
+    "FleetEvaluationResult": "eidos.core.recursive_autonomy",
+    "SemanticMemeIndex": "eidos.core.semantic_index",
+    "HashingVectorizer": "eidos.core.semantic_index",
+    "EventLog": "eidos.core.event_log",
+    "replay": "eidos.core.event_log",
+    "MetricsRegistry": "eidos.core.instrumentation",
+    "metrics": "eidos.core.instrumentation",
+    "instrumented": "eidos.core.instrumentation",
+    "DistributedSwarmProtocol": "eidos.protocol.swarm_runtime",
+    "MemePropagator": "eidos.protocol.meme_propagation",
+    "SwarmProtocol": "eidos.protocol.swarm_protocol",
+    "SwarmScheduler": "eidos.protocol.swarm_scheduler",
+}
+
+_LAZY_SUBMODULES = ("core", "protocol")
+
+__all__ = sorted(_LAZY_ATTRIBUTES) + list(_LAZY_SUBMODULES)
+
+TYPE_CHECKING = False # Avoids importing typing at package import time
+if TYPE_CHECKING:
+    from eidos.core.agent_spawner import Agent, AgentSpawner
+    from eidos.core.event_log import EventLog, replay
+    from eidos.core.instrumentation import MetricsRegistry, instrumented, metrics
+    from eidos.core.memetic_kernel import MemeticKernel, MemeUnit
+    from eidos.core.neurostack import Neurostack
+    from eidos.core.recursive_autonomy import FleetAutonomyPipeline, FleetEvaluationResult, RecursiveAutonomyEngine
+    from eidos.core.semantic_index import HashingVectorizer, SemanticMemeIndex
+    from eidos.protocol.meme_propagation import MemePropagator
+    from eidos.protocol.swarm_protocol import SwarmProtocol
+    from eidos.protocol.swarm_runtime import DistributedSwarmProtocol
+    from eidos.protocol.swarm_scheduler import SwarmScheduler
+
+
+def __getattr__(name):
+    import importlib
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,10 +2,12 @@
 
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
 
-# --- UPDATED IMPORT PATH ---
-from eidos.core.memetic_kernel import MemeticKernel # Import MemeticKernel for parent_kernel reference
+from eidos.core.instrumentation import instrumented
+
+if TYPE_CHECKING: # MemeticKernel is only used for the parent_kernel annotation
+    from eidos.core.memetic_kernel import MemeticKernel
 
 class Agent:
     """
@@ -19,6 +21,10 @@ class Agent:
         self.spawn_time = datetime.now()
         self.directives = directives if directives is not None else []
         self.status = "spawned"
+        self.inbox: List[Dict[str, Any]] = [] # Messages received from the swarm
+        self.scheduler = None # Optional SwarmScheduler notified when this agent's state changes
+        self.event_log = None # Optional EventLog recording belief and status changes
+        self.runtime = None # DistributedSwarmProtocol hosting this agent's state in a worker, while open
 
         self.local_belief = None
         if initial_memes:
@@ -42,6 +48,10 @@ class Agent:
     def update_status(self, new_status):
         """Update the agent's operational status."""
         self.status = new_status
+        if self.runtime is not None:
+            self.runtime.forward(self, "status", new_status)
+        if self.event_log is not None:
+            self.event_log.emit("status", self.id, new_status)
         print(f"Agent '{self.name}' status updated to: {self.status}")
 
     def express_belief(self) -> Any:
@@ -51,19 +61,36 @@ class Agent:
 
     def update_belief(self, new_belief: Any):
         """Agent updates its local belief based on consensus or synchronization."""
+        if self.scheduler is not None and new_belief != self.local_belief:
+            self.scheduler.mark_dirty(self.id, "belief")
         self.local_belief = new_belief
+        if self.runtime is not None:
+            self.runtime.forward(self, "belief", new_belief)
+        if self.event_log is not None:
+            self.event_log.emit("belief", self.id, new_belief)
         # print(f"Agent {self.name} updated belief to: {self.local_belief}")
 
+    def receive_message(self, message: Dict[str, Any]):
+        """Agent receives a message broadcast over the Swarm Protocol™."""
+        self.inbox.append(message)
+        if self.runtime is not None:
+            self.runtime.forward(self, "message", message)
+        if self.scheduler is not None:
+            self.scheduler.mark_dirty(self.id, "message")
+
 
 class AgentSpawner:
     """
     The Agent Spawner™ for the Eidos Protocol™.
     Enables dynamic creation, deployment, and initial orchestration of autonomous agents.
     """
-    def __init__(self, parent_kernel: MemeticKernel = None): # Type hint added for clarity
+    def __init__(self, parent_kernel: 'MemeticKernel' = None): # Type hint added for clarity
         self.spawned_agents: List[Agent] = []
         self.parent_kernel = parent_kernel # Reference to a global Memetic Kernel™ if applicable
+        self.spawner_id = str(uuid.uuid4())
+        self.event_log = None # Optional EventLog recording spawns
 
+    @instrumented("AgentSpawner.spawn_agent")
     def spawn_agent(self, name: str = None, directives: List[str] = None, initial_memes: List[Any] = None) -> Agent:
         """
         Spawns a new autonomous agent™ instance.
@@ -75,9 +102,14 @@ class AgentSpawner:
         new_agent = Agent(name=name, directives=directives, initial_memes=initial_memes,
                           parent_id=parent_id_str)
         self.spawned_agents.append(new_agent)
+        if self.event_log is not None:
+            from eidos.core.event_log import agent_state
+            self.event_log.emit("agent", agent_state(new_agent), self.spawner_id)
+            new_agent.event_log = self.event_log
         print(f"AgentSpawner™: Successfully spawned Agent '{new_agent.name}' with ID: {new_agent.id[:8]}")
         return new_agent
 
+    @instrumented("AgentSpawner.orchestrate_agents")
     def orchestrate_agents(self, agents_to_orchestrate: List[Agent]):
         """
         Placeholder for orchestrating a group of agents.
@@ -0,0 +1,366 @@
+# eidos/core/event_log.py
+
+import io
+import os
+import pickle
+import struct
+import time
+import zlib
+from contextlib import redirect_stdout
+from typing import Any, Dict, Iterator, List, Tuple
+
+# File layout: MAGIC, then frames of [payload length (u32) | payload CRC32 (u32) | payload].
+# Each payload is one pickled group-commit batch: a list of (kind, fields) records.
+# A torn or corrupt trailing frame (e.g. after a crash) ends the log.
+MAGIC = b"EIDOSLOG\x01"
+_FRAME_HEADER = struct.Struct("<II")
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+class EventLog:
+    """
+    Append-only, batched binary event log for Eidos SDK™ state changes.
+    Components with an ``event_log`` attribute call ``emit`` on every state change (ingest,
+    evolution, spawns, belief and status updates, consensus outcomes). Emitting only appends
+    to an in-memory batch; ``commit`` writes the whole batch as one frame (group commit),
+    optionally followed by fsync. With ``snapshot_every`` the log periodically compacts itself
+    into a single snapshot frame.
+
+    This is not a write-ahead log: events are emitted after the change is applied and sit in
+    memory until the next commit, which happens once ``batch_size`` events are buffered, on the
+    first emit at least ``commit_interval`` seconds after the previous commit (if set), or on
+    ``commit``/``close``. A crash loses everything emitted since the last commit, so a process
+    that goes quiet should call ``commit`` itself. ``close`` detaches every component it attached.
+
+    Frames are pickles, so reading a log (``replay``, ``read_events``, or reopening it, which
+    happens on ``compact``) can execute arbitrary code. Only open logs from trusted sources.
+    """
+    def __init__(self, path: str, batch_size: int = 1024, sync: bool = False, snapshot_every: int = None,
+                 commit_interval: float = None):
+        self.path = path
+        self.batch_size = batch_size
+        self.sync = sync # fsync after every commit for crash durability
+        self.snapshot_every = snapshot_every # Records between automatic compactions
+        self.commit_interval = commit_interval # Max seconds an emitted event waits for a later emit to commit it
+        self.records_written = 0
+        self._records_since_snapshot = 0
+        self._batch: List[Tuple[str, tuple]] = []
+        self._attached: Dict[int, Any] = {} # id() -> components whose event_log was set by attach
+        self._last_commit = time.monotonic()
+        self._file = self._open()
+
+    def _open(self):
+        handle = open(self.path, "ab")
+        if handle.tell() == 0:
+            handle.write(MAGIC)
+        else:
+            # Drop a torn tail left by a crash so new frames stay readable.
+            valid_length = _valid_length(self.path)
+            if valid_length < handle.tell():
+                handle.truncate(valid_length)
+                handle.seek(valid_length)
+        return handle
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+    def emit(self, kind: str, *fields):
+        """Records one event. Cheap: the event is only buffered until the next commit."""
+        if self._file is None:
+            raise ValueError(f"Cannot emit '{kind}': event log {self.path} is closed.")
+        self._batch.append((kind, fields))
+        if len(self._batch) >= self.batch_size or \
+                (self.commit_interval is not None and time.monotonic() - self._last_commit >= self.commit_interval):
+            self.commit()
+
+    def commit(self):
+        """Writes all buffered events as one frame."""
+        self._last_commit = time.monotonic()
+        if not self._batch:
+            return
+        payload = pickle.dumps(self._batch, _PICKLE_PROTOCOL)
+        self._file.write(_FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+        self.records_written += len(self._batch)
+        self._records_since_snapshot += len(self._batch)
+        self._batch = []
+        if self.snapshot_every is not None and self._records_since_snapshot >= self.snapshot_every:
+            self.compact()
+
+    def close(self):
+        """
+        Commits pending events, closes the file and detaches every component attached to the
+        log (including agents spawned or hosted by attached spawners and swarms since).
+        """
+        if self._file is not None:
+            self.commit()
+            self._file.close()
+            self._file = None
+            for component in self._attached.values():
+                members = [component]
+                members.extend(getattr(component, "spawned_agents", ()))
+                members.extend(getattr(component, "agents", ()))
+                for member in members:
+                    if member.event_log is self:
+                        member.event_log = None
+            self._attached = {}
+
+    def compact(self):
+        """
+        Replaces the log with a single snapshot of the state it describes.
+        Components can keep emitting afterwards; new events are appended after the snapshot.
+        """
+        self.commit()
+        self._file.close()
+        state = replay(self.path)
+        temporary_path = self.path + ".compact"
+        with open(temporary_path, "wb") as handle:
+            handle.write(MAGIC)
+            payload = pickle.dumps([("snapshot", (state.to_snapshot(),))], _PICKLE_PROTOCOL)
+            handle.write(_FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary_path, self.path)
+        self._records_since_snapshot = 0
+        self._file = self._open()
+
+    def attach(self, component: Any):
+        """
+        Starts logging a MemeticKernel, AgentSpawner, SwarmProtocol or Agent.
+        Its current state is recorded first so the log can rebuild it from scratch.
+        """
+        if hasattr(component, "meme_pool"):
+            self.emit("kernel", component.kernel_id, [meme_state(meme) for meme in component.meme_pool],
+                      list(component.history), list(component.known_origins))
+        elif hasattr(component, "spawned_agents"):
+            parent_kernel_id = getattr(component.parent_kernel, "kernel_id", None)
+            self.emit("spawner", component.spawner_id, parent_kernel_id)
+            for agent in component.spawned_agents:
+                self._attach_agent(agent, component.spawner_id)
+        elif hasattr(component, "swarm_id"):
+            for agent in component.agents:
+                self._attach_agent(agent)
+            self.emit("swarm", component.swarm_id, [agent.id for agent in component.agents],
+                      list(component.consensus_history))
+        else:
+            self._attach_agent(component)
+            return
+        component.event_log = self
+        self._attached[id(component)] = component
+
+    def _attach_agent(self, agent: Any, spawner_id: str = None):
+        if agent.event_log is not self:
+            self.emit("agent", agent_state(agent), spawner_id)
+            agent.event_log = self
+            self._attached[id(agent)] = agent
+
+
+def meme_state(meme: Any) -> tuple:
+    """Plain-data form of a MemeUnit™ as stored in the log."""
+    return (meme.content, meme.context, meme.fitness, meme.propagation_bias, list(meme.lineage),
+            meme.creation_time, meme.meme_id, meme.origin)
+
+
+def agent_state(agent: Any) -> tuple:
+    """Plain-data form of an Agent as stored in the log."""
+    return (agent.id, agent.name, agent.directives, agent.parent_id, agent.spawn_time,
+            agent.status, agent.local_belief, agent.local_memes)
+
+
+def _frames(handle) -> Iterator[Tuple[bytes, int]]:
+    """Yields (payload, end offset) for each intact frame, stopping at the first torn or corrupt one."""
+    if handle.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{handle.name} is not an Eidos event log.")
+    while True:
+        header = handle.read(_FRAME_HEADER.size)
+        if len(header) < _FRAME_HEADER.size:
+            return
+        length, checksum = _FRAME_HEADER.unpack(header)
+        payload = handle.read(length)
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            return
+        yield payload, handle.tell()
+
+
+def _valid_length(path: str) -> int:
+    """Byte length of the intact prefix of a log."""
+    with open(path, "rb") as handle:
+        end = len(MAGIC)
+        for _, end in _frames(handle):
+            pass
+        return end
+
+
+def read_events(path: str) -> Iterator[Tuple[str, tuple]]:
+    """
+    Yields (kind, fields) records from a log, stopping at the first torn or corrupt frame.
+    Records are unpickled: only read logs from trusted sources.
+    """
+    with open(path, "rb") as handle:
+        for payload, _ in _frames(handle):
+            yield from pickle.loads(payload)
+
+
+class ReplayState:
+    """Kernels, agents, spawners and swarms rebuilt from an event log, keyed by their IDs."""
+    def __init__(self):
+        self.kernels: Dict[str, Any] = {}
+        self.agents: Dict[str, Any] = {}
+        self.spawners: Dict[str, Any] = {}
+        self.swarms: Dict[str, Any] = {}
+        self.events_applied = 0
+
+    def __repr__(self):
+        return (f"ReplayState(kernels={len(self.kernels)}, agents={len(self.agents)}, "
+                f"spawners={len(self.spawners)}, swarms={len(self.swarms)}, events={self.events_applied})")
+
+    def to_snapshot(self) -> Dict[str, Any]:
+        """Plain-data snapshot of the rebuilt state."""
+        return {
+            "kernels": {kernel_id: ([meme_state(meme) for meme in kernel.meme_pool], kernel.history,
+                                    list(kernel.known_origins))
+                        for kernel_id, kernel in self.kernels.items()},
+            "agents": {agent_id: agent_state(agent) for agent_id, agent in self.agents.items()},
+            "spawners": {spawner_id: (getattr(spawner.parent_kernel, "kernel_id", None),
+                                      [agent.id for agent in spawner.spawned_agents])
+                         for spawner_id, spawner in self.spawners.items()},
+            "swarms": {swarm_id: ([agent.id for agent in swarm.agents], swarm.consensus_history)
+                       for swarm_id, swarm in self.swarms.items()}
+        }
+
+    def load_snapshot(self, snapshot: Dict[str, Any]):
+        """Replaces the current state with a snapshot."""
+        self.__init__()
+        for kernel_id, (memes, history, known_origins) in snapshot["kernels"].items():
+            self._restore_kernel(kernel_id, memes, history, known_origins)
+        for state in snapshot["agents"].values():
+            self._restore_agent(state)
+        for spawner_id, (parent_kernel_id, agent_ids) in snapshot["spawners"].items():
+            spawner = self._restore_spawner(spawner_id, parent_kernel_id)
+            spawner.spawned_agents = [self.agents[agent_id] for agent_id in agent_ids]
+        for swarm_id, (agent_ids, consensus_history) in snapshot["swarms"].items():
+            self._restore_swarm(swarm_id, agent_ids, consensus_history)
+
+    # --- Rebuilding helpers (no console output, no randomness) ---
+    def _restore_kernel(self, kernel_id: str, memes: List[tuple], history: List[str], known_origins: List[int]):
+        from eidos.core.memetic_kernel import MemeticKernel
+        kernel = MemeticKernel()
+        kernel.kernel_id = kernel_id
+        kernel.meme_pool = [_restore_meme(state) for state in memes]
+        kernel.history = list(history)
+        kernel.known_origins = set(known_origins)
+        self.kernels[kernel_id] = kernel
+
+    def _restore_agent(self, state: tuple):
+        from eidos.core.agent_spawner import Agent
+        agent_id, name, directives, parent_id, spawn_time, status, belief, local_memes = state
+        agent = Agent(name=name, directives=directives, parent_id=parent_id)
+        agent.id, agent.spawn_time, agent.status = agent_id, spawn_time, status
+        agent.local_belief, agent.local_memes = belief, local_memes
+        self.agents[agent_id] = agent
+        return agent
+
+    def _restore_spawner(self, spawner_id: str, parent_kernel_id: str):
+        from eidos.core.agent_spawner import AgentSpawner
+        spawner = AgentSpawner(parent_kernel=self.kernels.get(parent_kernel_id))
+        spawner.spawner_id = spawner_id
+        self.spawners[spawner_id] = spawner
+        return spawner
+
+    def _restore_swarm(self, swarm_id: str, agent_ids: List[str], consensus_history: List[Dict[str, Any]]):
+        from eidos.protocol.swarm_protocol import SwarmProtocol
+        with redirect_stdout(io.StringIO()): # Silences the constructor's console output
+            swarm = SwarmProtocol(swarm_id, [self.agents[agent_id] for agent_id in agent_ids])
+        swarm.consensus_history = list(consensus_history)
+        self.swarms[swarm_id] = swarm
+
+    def apply(self, kind: str, fields: tuple):
+        """Applies one logged event."""
+        if kind == "ingest":
+            kernel_id, content, context, fitness, creation_time, meme_id = fields
+            kernel = self.kernels[kernel_id]
+            meme = _restore_meme((content, context, fitness, 1.0, [], creation_time, meme_id, None))
+            kernel.meme_pool.append(meme)
+            kernel.history.append(f"Ingested: {content[:50]}")
+        elif kind == "evolve":
+            kernel_id, mutated_indexes, recombined_pair = fields
+            kernel = self.kernels[kernel_id]
+            pool = kernel.meme_pool
+            for index in mutated_indexes:
+                pool[index].apply_mutation()
+            if recombined_pair is not None:
+                first, second, child_id = recombined_pair
+                child = pool[first].combine(pool[second])
+                child.meme_id = child_id
+                pool.append(child)
+        elif kind == "select":
+            self.kernels[fields[0]].prune_and_decay()
+        elif kind == "evolved":
+            kernel = self.kernels[fields[0]]
+            kernel.history.append(f"Evolved step, memes in pool: {len(kernel.meme_pool)}")
+        elif kind == "adopt":
+            kernel_id, memes = fields
+            kernel = self.kernels[kernel_id]
+            adopted = [_restore_meme(state) for state in memes]
+            kernel.meme_pool.extend(adopted)
+            kernel.known_origins.update(meme.origin_id for meme in adopted)
+            kernel.history.append(f"Adopted {len(memes)} shared memes")
+        elif kind == "shared":
+            self.kernels[fields[0]].known_origins.update(fields[1])
+        elif kind == "belief":
+            self.agents[fields[0]].local_belief = fields[1]
+        elif kind == "swarm_belief":
+            for agent in self.swarms[fields[0]].agents:
+                agent.local_belief = fields[1]
+        elif kind == "status":
+            self.agents[fields[0]].status = fields[1]
+        elif kind == "consensus":
+            self.swarms[fields[0]].consensus_history.append(fields[1])
+        elif kind == "agent":
+            state, spawner_id = fields
+            agent = self._restore_agent(state)
+            if spawner_id is not None:
+                self.spawners[spawner_id].spawned_agents.append(agent)
+        elif kind == "kernel":
+            self._restore_kernel(*fields)
+        elif kind == "spawner":
+            self._restore_spawner(*fields)
+        elif kind == "swarm":
+            self._restore_swarm(*fields)
+        elif kind == "snapshot":
+            self.load_snapshot(fields[0])
+        else:
+            raise ValueError(f"Unknown event kind in log: '{kind}'")
+        self.events_applied += 1
+
+
+def _restore_meme(state: tuple):
+    from eidos.core.memetic_kernel import MemeUnit
+    content, context, fitness, propagation_bias, lineage, creation_time, meme_id, origin = state
+    meme = MemeUnit(content, context=context, initial_fitness=fitness)
+    meme.propagation_bias = propagation_bias
+    meme.lineage = list(lineage)
+    meme.creation_time = creation_time
+    meme.meme_id, meme.origin = meme_id, origin
+    return meme
+
+
+def replay(path: str) -> ReplayState:
+    """
+    Rebuilds kernel, agent, spawner and swarm state from an event log.
+    The log is unpickled, so never replay a log from an untrusted source.
+    """
+    state = ReplayState()
+    apply = state.apply
+    for kind, fields in read_events(path):
+        apply(kind, fields)
+    return state
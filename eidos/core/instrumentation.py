@@ -0,0 +1,191 @@
+# eidos/core/instrumentation.py
+
+import functools
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf.
+DEFAULT_LATENCY_BUCKETS = (
+    0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram for one instrumented operation."""
+    __slots__ = ("bounds", "bucket_counts", "count", "total", "errors")
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.bucket_counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.errors = 0
+
+    def observe(self, seconds: float):
+        """Records one observation."""
+        self.bucket_counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the histogram as plain data, with cumulative bucket counts."""
+        cumulative, running = {}, 0
+        for bound, bucket_count in zip(self.bounds + (float("inf"),), self.bucket_counts):
+            running += bucket_count
+            cumulative["+Inf" if bound == float("inf") else repr(bound)] = running
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_seconds": self.total,
+            "mean_seconds": self.total / self.count if self.count else 0.0,
+            "buckets": cumulative
+        }
+
+
+class TickTrace:
+    """Spans recorded by instrumented calls while a trace is active."""
+    def __init__(self, name: str):
+        self.name = name
+        self.started_at = time.perf_counter()
+        self.duration = None
+        self.spans: List[Tuple[str, float, float]] = [] # (operation, start offset, duration) in seconds
+
+    def __repr__(self):
+        return f"TickTrace(name='{self.name}', spans={len(self.spans)}, duration={self.duration})"
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the trace as plain data."""
+        return {
+            "name": self.name,
+            "duration_seconds": self.duration,
+            "spans": [
+                {"operation": operation, "start_seconds": start, "duration_seconds": duration}
+                for operation, start, duration in self.spans
+            ]
+        }
+
+
+class MetricsRegistry:
+    """
+    Collects call counters and latency histograms for instrumented Eidos SDK™ operations.
+    Disabled by default; while disabled, instrumented methods only pay for one flag check.
+    """
+    def __init__(self, enabled: bool = False, latency_buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.enabled = enabled
+        self.latency_buckets = latency_buckets
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.counters: Dict[str, float] = {}
+        self.active_trace: TickTrace = None
+
+    def enable(self):
+        """Starts collecting metrics."""
+        self.enabled = True
+
+    def disable(self):
+        """Stops collecting metrics; recorded values are kept."""
+        self.enabled = False
+
+    def reset(self):
+        """Drops all recorded metrics."""
+        self.histograms.clear()
+        self.counters.clear()
+
+    def increment(self, name: str, amount: float = 1):
+        """Increments a free-standing counter (no-op while disabled)."""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_call(self, operation: str, seconds: float, failed: bool = False):
+        """Records the latency of one call to an instrumented operation."""
+        histogram = self.histograms.get(operation)
+        if histogram is None:
+            histogram = self.histograms[operation] = LatencyHistogram(self.latency_buckets)
+        histogram.observe(seconds)
+        if failed:
+            histogram.errors += 1
+        if self.active_trace is not None:
+            trace = self.active_trace
+            trace.spans.append((operation, time.perf_counter() - seconds - trace.started_at, seconds))
+
+    @contextmanager
+    def trace(self, name: str = "swarm_tick") -> Iterator[TickTrace]:
+        """
+        Traces one swarm tick end to end: every instrumented call inside the block is recorded
+        as a span, and the whole block is recorded under ``trace.<name>``.
+        Metrics are collected for the duration of the block even if the registry is disabled.
+        """
+        previous_trace, previous_enabled = self.active_trace, self.enabled
+        tick_trace = TickTrace(name)
+        self.active_trace, self.enabled = tick_trace, True
+        try:
+            yield tick_trace
+        finally:
+            tick_trace.duration = time.perf_counter() - tick_trace.started_at
+            self.active_trace, self.enabled = previous_trace, previous_enabled
+            self.record_call(f"trace.{name}", tick_trace.duration)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns all metrics as a dict."""
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "operations": {operation: histogram.as_dict() for operation, histogram in self.histograms.items()},
+            "counters": dict(self.counters)
+        }
+
+    def to_prometheus(self, prefix: str = "eidos") -> str:
+        """Renders all metrics in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {prefix}_operation_duration_seconds Latency of instrumented Eidos SDK operations.",
+            f"# TYPE {prefix}_operation_duration_seconds histogram"
+        ]
+        for operation, histogram in sorted(self.histograms.items()):
+            for le, cumulative in histogram.as_dict()["buckets"].items():
+                lines.append(f'{prefix}_operation_duration_seconds_bucket{{operation="{operation}",le="{le}"}} {cumulative}')
+            lines.append(f'{prefix}_operation_duration_seconds_sum{{operation="{operation}"}} {histogram.total}')
+            lines.append(f'{prefix}_operation_duration_seconds_count{{operation="{operation}"}} {histogram.count}')
+        lines.append(f"# HELP {prefix}_operation_errors_total Instrumented calls that raised an exception.")
+        lines.append(f"# TYPE {prefix}_operation_errors_total counter")
+        for operation, histogram in sorted(self.histograms.items()):
+            lines.append(f'{prefix}_operation_errors_total{{operation="{operation}"}} {histogram.errors}')
+        for name, value in sorted(self.counters.items()):
+            metric = f"{prefix}_{name.replace('.', '_')}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_jsonl(self, path: str) -> Dict[str, Any]:
+        """Appends the current snapshot as one line to a JSON lines file and returns it."""
+        import json
+        snapshot = self.snapshot()
+        with open(path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(snapshot) + "\n")
+        return snapshot
+
+
+# Process-wide registry used by the instrumented SDK components.
+metrics = MetricsRegistry()
+
+
+def instrumented(operation: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator recording call latency for ``operation`` in the global ``metrics`` registry.
+    When the registry is disabled the wrapped function is called directly.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                metrics.record_call(operation, time.perf_counter() - start, failed=True)
+                raise
+            metrics.record_call(operation, time.perf_counter() - start)
+            return result
+        return wrapper
+    return decorator
@@ -1,9 +1,26 @@
 # eidos/core/memetic_kernel.py
 
+import itertools
+import os
 import random
 from datetime import datetime
 from typing import Any, Dict, List, Tuple
 import uuid # <--- ADD THIS LINE HERE
+from eidos.core.instrumentation import instrumented
+
+# Process-wide MemeUnit™ IDs. Random high bits keep IDs minted by different processes apart,
+# so memes rebuilt from an event log never collide with new ones. Forked children (process
+# pool and swarm runtime workers) would inherit the parent's counter, so they draw new bits.
+def _new_meme_ids():
+    return itertools.count((int.from_bytes(os.urandom(4), "big") << 32) + 1)
+
+def _reseed_meme_ids():
+    global _meme_ids
+    _meme_ids = _new_meme_ids()
+
+_meme_ids = _new_meme_ids()
+if hasattr(os, "register_at_fork"): # POSIX only; spawned children re-import this module anyway
+    os.register_at_fork(after_in_child=_reseed_meme_ids)
 
 class MemeUnit:
     """
@@ -18,21 +35,38 @@ class MemeUnit:
         self.lineage = [] # To track its origin and evolution (parent memes, mutations)
         self.associated_behaviors = [] # Pointers to actions or functions it influences
         self.creation_time = datetime.now() # Added for potential 'age' based selection
+        self.meme_id = next(_meme_ids)
+        self.origin = None # meme_id of the original MemeUnit™ this one was shared from, if any
 
     def __repr__(self):
         content_str = str(self.content)
         return f"MemeUnit(content='{content_str[:20]}...', fitness={self.fitness:.2f})"
 
+    @property
+    def origin_id(self) -> int:
+        """ID of the original MemeUnit™ this one descends from by sharing (its own ID if not shared)."""
+        return self.origin if self.origin is not None else self.meme_id
+
     def mutate(self):
         """Applies a basic, placeholder mutation to the MemeUnit™."""
+        self.apply_mutation()
+        print(f"MemeUnit™ mutated: {self.content}")
+
+    def apply_mutation(self):
+        """The mutation itself, without console output (also used when replaying event logs)."""
         # In a real system, this would be more complex (e.g., semantic mutation, data alteration)
         self.content = str(self.content) + "_mutated"
         self.fitness *= 0.9 # Simple fitness decay upon mutation for this example
         self.lineage.append(f"mutated_at_step_{len(self.lineage)}")
-        print(f"MemeUnit™ mutated: {self.content}")
 
     def recombine(self, other_meme: 'MemeUnit') -> 'MemeUnit':
         """Applies a basic, placeholder recombination with another MemeUnit™."""
+        new_meme = self.combine(other_meme)
+        print(f"MemeUnit™ recombined: {new_meme.content}")
+        return new_meme
+
+    def combine(self, other_meme: 'MemeUnit') -> 'MemeUnit':
+        """The recombination itself, without console output (also used when replaying event logs)."""
         # In a real system, this would combine content or rules meaningfully
         new_content = f"({self.content} & {other_meme.content})"
         new_fitness = (self.fitness + other_meme.fitness) / 2
@@ -41,9 +75,19 @@ class MemeUnit:
             f"recombined_from_{self.lineage[-1] if self.lineage else self.content}",
             f"recombined_from_{other_meme.lineage[-1] if other_meme.lineage else other_meme.content}"
         ])
-        print(f"MemeUnit™ recombined: {new_meme.content}")
         return new_meme
 
+    def share(self) -> 'MemeUnit':
+        """
+        Creates a lightweight copy of this MemeUnit™ for another kernel.
+        Content and context are shared by reference (mutation replaces content rather than
+        editing it), while fitness and lineage stay local to the receiving kernel.
+        """
+        shared = MemeUnit(self.content, context=self.context, initial_fitness=self.fitness)
+        shared.propagation_bias = self.propagation_bias
+        shared.origin = self.origin_id
+        return shared
+
 
 class MemeticKernel:
     """
@@ -51,19 +95,66 @@ class MemeticKernel:
     It manages the ingestion, evolution, selection, and retrieval of Memetic Units™.
     This is a core component of the Eidos Protocol™.
     """
-    def __init__(self):
+    def __init__(self, semantic_index=None):
         self.meme_pool: List[MemeUnit] = [] # Stores all MemeUnit™ instances
         self.history: List[str] = [] # For auditing or long-term analysis of meme evolution
         self.kernel_id = str(uuid.uuid4()) # Added for agent_spawner reference
+        self.scheduler = None # Optional SwarmScheduler notified when new memes arrive
+        self.semantic_index = semantic_index # Optional SemanticMemeIndex, created on first semantic query
+        self.known_origins = set() # Origin IDs of pooled memes this kernel has sent or adopted, to avoid echoes
+        self.event_log = None # Optional EventLog recording this kernel's state changes
 
+    @instrumented("MemeticKernel.ingest")
     def ingest(self, data: Any, context: Dict[str, Any] = None, initial_fitness: float = 0.1) -> MemeUnit:
         """Ingest raw data or information to form new Memetic Units™."""
         new_meme = MemeUnit(content=data, context=context, initial_fitness=initial_fitness)
         self.meme_pool.append(new_meme)
+        if self.semantic_index is not None:
+            self.semantic_index.add(new_meme)
         self.history.append(f"Ingested: {new_meme.content[:50]}")
+        if self.event_log is not None:
+            self.event_log.emit("ingest", self.kernel_id, data, new_meme.context, initial_fitness,
+                                new_meme.creation_time, new_meme.meme_id)
         print(f"Memetic Kernel™ ingested new MemeUnit™: {new_meme}")
+        if self.scheduler is not None:
+            self.scheduler.mark_dirty(self.kernel_id, "ingest")
         return new_meme
 
+    @instrumented("MemeticKernel.adopt")
+    def adopt(self, memes: List[MemeUnit]) -> int:
+        """
+        Adopts a batch of memes shared by another kernel, skipping any whose origin this
+        kernel already knows. Returns the number of memes added to the pool.
+        """
+        adopted = []
+        for meme in memes:
+            origin_id = meme.origin_id
+            if origin_id not in self.known_origins:
+                self.known_origins.add(origin_id)
+                adopted.append(meme)
+        if not adopted:
+            return 0
+
+        self.meme_pool.extend(adopted)
+        if self.semantic_index is not None:
+            for meme in adopted:
+                self.semantic_index.add(meme)
+        self.history.append(f"Adopted {len(adopted)} shared memes")
+        if self.event_log is not None:
+            from eidos.core.event_log import meme_state
+            self.event_log.emit("adopt", self.kernel_id, [meme_state(meme) for meme in adopted])
+        if self.scheduler is not None:
+            self.scheduler.mark_dirty(self.kernel_id, "ingest")
+        return len(adopted)
+
+    def mark_shared(self, memes: List[MemeUnit]):
+        """Records that these memes were sent to other kernels, so shares echoing back are ignored."""
+        origin_ids = [meme.origin_id for meme in memes]
+        self.known_origins.update(origin_ids)
+        if self.event_log is not None:
+            self.event_log.emit("shared", self.kernel_id, origin_ids)
+
+    @instrumented("MemeticKernel.evolve_step")
     def evolve_step(self):
         """
         Performs a single step of memetic evolution within the kernel.
@@ -71,27 +162,42 @@ class MemeticKernel:
         """
         print("Memetic Kernel™ is evolving...")
         new_memes_from_evolution: List[MemeUnit] = []
+        mutated_indexes: List[int] = [] # Recorded for the event log
+        recombined_pair = None
 
         # Apply mutation to existing memes
-        for meme in list(self.meme_pool): # Iterate over a copy to allow modification
+        for index, meme in enumerate(list(self.meme_pool)): # Iterate over a copy to allow modification
             if self.should_mutate(meme): # Placeholder for mutation probability
                 meme.mutate()
+                mutated_indexes.append(index)
+                if self.semantic_index is not None:
+                    self.semantic_index.mark_stale(meme) # Content changed; re-embedded in a batch before the next query
                 # A mutated meme could be considered 'new' or replace original, depending on design
                 # For this example, we just modify in place
 
         # Apply recombination
         if len(self.meme_pool) >= 2:
-            m1, m2 = random.sample(self.meme_pool, 2)
+            i1, i2 = random.sample(range(len(self.meme_pool)), 2) # Same draw as sampling the pool itself
+            m1, m2 = self.meme_pool[i1], self.meme_pool[i2]
             if self.should_recombine(m1, m2): # Placeholder for recombination probability/conditions
-                new_memes_from_evolution.append(m1.recombine(m2))
+                child = m1.recombine(m2)
+                new_memes_from_evolution.append(child)
+                recombined_pair = (i1, i2, child.meme_id)
 
         # Add newly generated memes from evolution to the pool
         self.meme_pool.extend(new_memes_from_evolution)
+        if self.semantic_index is not None:
+            for meme in new_memes_from_evolution:
+                self.semantic_index.add(meme)
+        if self.event_log is not None:
+            self.event_log.emit("evolve", self.kernel_id, mutated_indexes, recombined_pair)
 
         # Apply selection/pruning based on fitness
         self.apply_selection()
 
         self.history.append(f"Evolved step, memes in pool: {len(self.meme_pool)}")
+        if self.event_log is not None:
+            self.event_log.emit("evolved", self.kernel_id)
         print(f"Memetic Kernel™ evolution step complete. Current meme pool size: {len(self.meme_pool)}")
 
     def apply_selection(self):
@@ -99,27 +205,55 @@ class MemeticKernel:
         Selects memes based on their fitness, potentially pruning low-fitness memes.
         This embodies the 'natural selection' aspect of the Memetic Kernel™.
         """
+        if self.event_log is not None:
+            self.event_log.emit("select", self.kernel_id)
+        if self.semantic_index is not None:
+            for meme in self.meme_pool:
+                if meme.fitness <= 0.05:
+                    self.semantic_index.remove(meme)
+        pruned = self.prune_and_decay()
+        if pruned:
+            print(f"Memetic Kernel™ pruned {pruned} low-fitness memes.")
+
+    def prune_and_decay(self) -> int:
+        """
+        The selection rule itself, without console output (also used when replaying event logs).
+        Returns the number of memes pruned.
+        """
         # Example: Remove memes below a certain fitness threshold or prune oldest low-fitness memes
         initial_count = len(self.meme_pool)
+        if self.known_origins: # Forget origins of pruned memes so the set stays bounded by the pool
+            for meme in self.meme_pool:
+                if meme.fitness <= 0.05:
+                    self.known_origins.discard(meme.origin_id)
         self.meme_pool = [meme for meme in self.meme_pool if meme.fitness > 0.05] # Keep memes above threshold
-        if len(self.meme_pool) < initial_count:
-            print(f"Memetic Kernel™ pruned {initial_count - len(self.meme_pool)} low-fitness memes.")
-        
+
         # Simple fitness decay for all active memes over time
         for meme in self.meme_pool:
             meme.fitness *= 0.95 # Gradual decay
+        return initial_count - len(self.meme_pool)
 
-    def retrieve_memes(self, query: Any = None, count: int = 1, sort_by: str = 'fitness') -> List[MemeUnit]:
+    @instrumented("MemeticKernel.retrieve_memes")
+    def retrieve_memes(self, query: Any = None, count: int = 1, sort_by: str = 'fitness',
+                       mode: str = 'substring', fitness_weight: float = 0.5) -> List[MemeUnit]:
         """
         Retrieve memes from the pool based on query, fitness, or other criteria.
+        With mode='semantic', memes are ranked by embedding similarity to the query plus
+        ``fitness_weight`` times their fitness, using the approximate nearest-neighbor index.
         """
         if not self.meme_pool:
             return []
 
+        if mode == 'semantic' and query:
+            if self.semantic_index is None:
+                self.enable_semantic_index()
+            return [meme for _, meme in self.semantic_index.search(query, count, fitness_weight)]
+        elif mode not in ('substring', 'semantic'):
+            raise ValueError(f"Unknown retrieval mode: '{mode}'")
+
         results = list(self.meme_pool)
 
         if query:
-            # Placeholder for semantic search or pattern matching
             results = [meme for meme in results if query.lower() in str(meme.content).lower()]
 
         if sort_by == 'fitness':
@@ -130,6 +264,19 @@ class MemeticKernel:
 
         return results[:count]
 
+    def enable_semantic_index(self, semantic_index=None):
+        """
+        Attaches a semantic index (a default SemanticMemeIndex if none is given) and indexes
+        the current pool. From then on ingest, evolution and pruning keep it up to date.
+        """
+        if semantic_index is None:
+            from eidos.core.semantic_index import SemanticMemeIndex
+            semantic_index = SemanticMemeIndex()
+        for meme in self.meme_pool:
+            semantic_index.add(meme)
+        self.semantic_index = semantic_index
+        return semantic_index
+
     def get_status(self) -> Dict[str, Any]:
         """Get current status of the Memetic Kernel™."""
         return {
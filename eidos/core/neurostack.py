@@ -3,6 +3,7 @@
 from typing import Any, Dict, List
 import random
 from datetime import datetime
+from eidos.core.instrumentation import instrumented
 
 class Neurostack:
     """
@@ -26,6 +27,7 @@ class Neurostack:
             "processing_units": 100
         }
 
+    @instrumented("Neurostack.process_neural_activity")
     def process_neural_activity(self, input_data: Any) -> Any:
         """
         Simulates the processing of neural-like activity or sensory input within the Neurostack™.
@@ -46,6 +48,7 @@ class Neurostack:
         print(f"Neurostack™ for Agent {self.agent_id[:4]}: Processed neural activity. Output hash: {log_entry['output_hash']}")
         return processed_output
 
+    @instrumented("Neurostack.simulate_cognition")
     def simulate_cognition(self, cognitive_task: str, complexity: float = 1.0) -> Dict[str, Any]:
         """
         Simulates a cognitive process within the Neurostack™, like reasoning or decision-making.
@@ -72,6 +75,7 @@ class Neurostack:
         print(f"Neurostack™ for Agent {self.agent_id[:4]}: Simulated cognition for '{cognitive_task}'. Confidence: {result['confidence_score']:.2f}")
         return result
 
+    @instrumented("Neurostack.integrate_sensory_input")
     def integrate_sensory_input(self, sensory_stream: Dict[str, Any]) -> Any:
         """
         Simulates the integration of raw sensory data (visual, auditory, tactile) into the cognitive state.
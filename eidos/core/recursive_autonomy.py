@@ -1,6 +1,7 @@
 # eidos/core/recursive_autonomy.py <-- Note the conceptual path change
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence, Tuple
+from array import array
 from datetime import datetime
 import random
 
@@ -8,6 +9,18 @@ import random
 # from eidos.core.memetic_kernel import MemeticKernel # Example import if needed later
 # from eidos.core.agent_spawner import Agent # Example import if needed later
 
+# Evaluation and simulation parameters, shared by RecursiveAutonomyEngine and the fleet pipeline.
+DEFAULT_PERFORMANCE = 0.75 # Assumed when an agent's state has no "performance"
+DEFAULT_ALIGNMENT = 0.9 # Assumed when an agent's state has no "alignment"
+PERFORMANCE_VARIABILITY = (0.8, 1.2) # Range of the random factor applied to performance
+PERFORMANCE_THRESHOLD = 0.8 # Scores below this propose a code optimization
+ALIGNMENT_THRESHOLD = 0.85 # Alignment below this proposes a directive refinement
+GAIN_RANGE = (0.01, 0.15) # Predicted long-term performance gain
+STABILITY_RANGE = (0.9, 0.99) # Predicted alignment stability
+RISK_RANGE = (0.01, 0.1) # Risk of unforeseen consequences
+REFINEMENT_STABILITY_FACTOR = 1.05 # Directive refinements are more stable...
+REFINEMENT_RISK_FACTOR = 0.8 # ...and less risky
+
 class RecursiveAutonomyEngine:
     """
     The Recursive Autonomy™ engine for the Eidos Protocol™.
@@ -27,15 +40,15 @@ class RecursiveAutonomyEngine:
         """
         evaluation_result = {
             "timestamp": datetime.now().isoformat(),
-            "performance_score": current_state.get("performance", 0.75) * random.uniform(0.8, 1.2), # Simulate variability
-            "directive_alignment": current_state.get("alignment", 0.9),
+            "performance_score": current_state.get("performance", DEFAULT_PERFORMANCE) * random.uniform(*PERFORMANCE_VARIABILITY), # Simulate variability
+            "directive_alignment": current_state.get("alignment", DEFAULT_ALIGNMENT),
             "internal_consistency": current_state.get("consistency", 0.95),
             "areas_for_improvement": []
         }
 
-        if evaluation_result["performance_score"] < 0.8:
+        if evaluation_result["performance_score"] < PERFORMANCE_THRESHOLD:
             evaluation_result["areas_for_improvement"].append("Performance Optimization")
-        if evaluation_result["directive_alignment"] < 0.85:
+        if evaluation_result["directive_alignment"] < ALIGNMENT_THRESHOLD:
             evaluation_result["areas_for_improvement"].append("Directive Re-alignment")
 
         print(f"RecursiveAutonomyEngine™: Agent {self.agent_id[:4]} self-evaluated. Score: {evaluation_result['performance_score']:.2f}")
@@ -73,14 +86,14 @@ class RecursiveAutonomyEngine:
 
         # This is a very simplified simulation
         sim_outcome = {
-            "predicted_long_term_performance_gain": random.uniform(0.01, 0.15) if proposed_modification["type"] != "none" else 0,
-            "predicted_alignment_stability": random.uniform(0.9, 0.99),
-            "risk_of_unforeseen_consequences": random.uniform(0.01, 0.1),
+            "predicted_long_term_performance_gain": random.uniform(*GAIN_RANGE) if proposed_modification["type"] != "none" else 0,
+            "predicted_alignment_stability": random.uniform(*STABILITY_RANGE),
+            "risk_of_unforeseen_consequences": random.uniform(*RISK_RANGE),
             "timeline_scenario": f"Optimistic_Growth_Scenario_{simulation_horizon_years}Y"
         }
         if proposed_modification["type"] == "directive_refinement":
-            sim_outcome["predicted_alignment_stability"] *= 1.05
-            sim_outcome["risk_of_unforeseen_consequences"] *= 0.8
+            sim_outcome["predicted_alignment_stability"] *= REFINEMENT_STABILITY_FACTOR
+            sim_outcome["risk_of_unforeseen_consequences"] *= REFINEMENT_RISK_FACTOR
 
         print(f"RecursiveAutonomyEngine™: Simulation complete. Predicted gain: {sim_outcome['predicted_long_term_performance_gain']:.2f}, Risk: {sim_outcome['risk_of_unforeseen_consequences']:.2f}")
         self.evolution_log.append({
@@ -106,3 +119,269 @@ class RecursiveAutonomyEngine:
     def get_evolution_log(self) -> List[Dict[str, Any]]:
         """Returns the history of self-evaluation and modification attempts."""
         return self.evolution_log
+
+
+# Proposal codes used by the fleet pipeline's compact results.
+PROPOSAL_NONE = 0
+PROPOSAL_CODE_OPTIMIZATION = 1
+PROPOSAL_DIRECTIVE_REFINEMENT = 2
+
+PROPOSAL_TYPES = {
+    PROPOSAL_NONE: "none",
+    PROPOSAL_CODE_OPTIMIZATION: "code_optimization",
+    PROPOSAL_DIRECTIVE_REFINEMENT: "directive_refinement",
+}
+
+
+# Columns of the fleet buffer shared with pool workers, in layout order.
+_SHARED_COLUMNS = (
+    ("performance", 'd'), ("alignment", 'd'), ("scores", 'd'), ("gains", 'd'),
+    ("stabilities", 'd'), ("risks", 'd'), ("proposals", 'b'), ("modified", 'b'),
+)
+_ITEMSIZE = {'d': 8, 'b': 1}
+_RESULT_COLUMNS = ("scores", "proposals", "gains", "stabilities", "risks", "modified")
+
+
+def _shared_columns(buffer: memoryview, capacity: int) -> Dict[str, memoryview]:
+    """Typed views of each column inside a shared fleet buffer with room for ``capacity`` agents."""
+    columns, offset = {}, 0
+    for name, typecode in _SHARED_COLUMNS:
+        size = capacity * _ITEMSIZE[typecode]
+        columns[name] = buffer[offset:offset + size].cast(typecode)
+        offset += size
+    return columns
+
+
+def _evaluate_fleet_range(columns: Dict[str, Any], start: int, stop: int, seed: int,
+                          min_stability: float, max_risk: float):
+    """
+    Runs evaluate -> propose -> simulate -> modify for agents ``start:stop`` of a fleet,
+    reading the input columns and writing the result columns of ``columns`` in place.
+    """
+    performance, alignment = columns["performance"], columns["alignment"]
+    scores, proposals, gains = columns["scores"], columns["proposals"], columns["gains"]
+    stabilities, risks, modified = columns["stabilities"], columns["risks"], columns["modified"]
+    rng = random.Random(seed)
+    uniform = rng.uniform
+    low, high = PERFORMANCE_VARIABILITY
+
+    # Evaluate and propose for every agent in the range (same rules as
+    # RecursiveAutonomyEngine.self_evaluate / propose_self_modification).
+    proposers = []
+    for i in range(start, stop):
+        score = performance[i] * uniform(low, high)
+        scores[i] = score
+        gains[i] = stabilities[i] = risks[i] = 0.0
+        modified[i] = 0
+        if score < PERFORMANCE_THRESHOLD:
+            proposals[i] = PROPOSAL_CODE_OPTIMIZATION
+            proposers.append(i)
+        elif alignment[i] < ALIGNMENT_THRESHOLD:
+            proposals[i] = PROPOSAL_DIRECTIVE_REFINEMENT
+            proposers.append(i)
+        else:
+            proposals[i] = PROPOSAL_NONE
+
+    # Only agents that proposed something are simulated (as in simulate_timeline_impact).
+    for i in proposers:
+        gain = uniform(*GAIN_RANGE)
+        stability = uniform(*STABILITY_RANGE)
+        risk = uniform(*RISK_RANGE)
+        if proposals[i] == PROPOSAL_DIRECTIVE_REFINEMENT:
+            stability *= REFINEMENT_STABILITY_FACTOR
+            risk *= REFINEMENT_RISK_FACTOR
+        gains[i] = gain
+        stabilities[i] = stability
+        risks[i] = risk
+        if (min_stability is None or stability > min_stability) and (max_risk is None or risk < max_risk):
+            modified[i] = 1
+
+
+# Shared fleet buffer attached in a pool worker: (segment name, SharedMemory, column views).
+_worker_buffer = None
+
+
+def _evaluate_shared_chunk(args):
+    """
+    Pool worker entry point. Only the segment name and chunk bounds are sent; the worker
+    attaches the pipeline's shared buffer once and reuses it until the pipeline reallocates it.
+    """
+    global _worker_buffer
+    name, capacity, start, stop, seed, min_stability, max_risk = args
+    if _worker_buffer is None or _worker_buffer[0] != name:
+        from multiprocessing import shared_memory
+        if _worker_buffer is not None: # The pipeline grew its buffer; drop the old mapping
+            _, previous, previous_columns = _worker_buffer
+            for view in previous_columns.values():
+                view.release()
+            previous.close()
+        shared = shared_memory.SharedMemory(name=name)
+        _worker_buffer = (name, shared, _shared_columns(shared.buf, capacity))
+    _evaluate_fleet_range(_worker_buffer[2], start, stop, seed, min_stability, max_risk)
+
+
+def _as_doubles(values: Sequence[float]) -> array:
+    if isinstance(values, array) and values.typecode == 'd':
+        return values
+    return array('d', values)
+
+
+class FleetEvaluationResult:
+    """
+    Compact, column-oriented results of one fleet self-evaluation pass.
+    Each column is an ``array`` aligned with ``agent_ids``; simulation columns are
+    0.0 for agents that did not propose a modification.
+    """
+    __slots__ = ("agent_ids", "performance_score", "proposal_type", "predicted_gain",
+                 "predicted_stability", "predicted_risk", "modified")
+
+    def __init__(self, agent_ids: Sequence[str], columns: Tuple[array, array, array, array, array, array]):
+        self.agent_ids = agent_ids
+        (self.performance_score, self.proposal_type, self.predicted_gain,
+         self.predicted_stability, self.predicted_risk, self.modified) = columns
+
+    def __len__(self) -> int:
+        return len(self.agent_ids)
+
+    def __repr__(self):
+        return f"FleetEvaluationResult(agents={len(self)}, proposals={self.proposal_count()}, modified={self.modified_count()})"
+
+    def proposal_count(self) -> int:
+        """Number of agents that proposed a self-modification."""
+        return len(self.proposal_type) - self.proposal_type.count(PROPOSAL_NONE)
+
+    def modified_count(self) -> int:
+        """Number of agents that went on to self-modify."""
+        return self.modified.count(1)
+
+    def get(self, index: int) -> Dict[str, Any]:
+        """Expands the result for a single agent into a dict, mirroring the per-agent engine output."""
+        return {
+            "agent_id": self.agent_ids[index],
+            "performance_score": self.performance_score[index],
+            "proposal_type": PROPOSAL_TYPES[self.proposal_type[index]],
+            "predicted_long_term_performance_gain": self.predicted_gain[index],
+            "predicted_alignment_stability": self.predicted_stability[index],
+            "risk_of_unforeseen_consequences": self.predicted_risk[index],
+            "modified": bool(self.modified[index]),
+        }
+
+
+class FleetAutonomyPipeline:
+    """
+    Fleet-level Recursive Autonomy™ pipeline.
+    Runs self-evaluation, proposal, timeline simulation and self-modification for many
+    agents from column arrays of agent state, without per-agent engines, dicts or logging.
+    Evaluation is not vectorized: each agent is still scored by a plain Python loop using the
+    same rules and parameters as RecursiveAutonomyEngine; the savings come from skipping the
+    per-agent objects and console output, and from spreading chunks over worker processes.
+    With ``workers > 1`` large fleets are split into chunks evaluated by a process pool that
+    is started on first use and kept for later runs. State columns live in one shared-memory
+    buffer, so each run only sends chunk bounds to the workers. Call ``close`` (or use the
+    pipeline as a context manager) to stop the pool and free the buffer.
+    """
+    def __init__(self, min_stability: float = None, max_risk: float = None,
+                 workers: int = 1, chunk_size: int = 10000, seed: int = None):
+        self.min_stability = min_stability # Optional gates applied before self-modification
+        self.max_risk = max_risk
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self._pool = None
+        self._shared = None
+        self._shared_capacity = 0
+        self._columns: Dict[str, memoryview] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def run(self, agent_ids: Sequence[str], performance: Sequence[float],
+            alignment: Sequence[float] = None) -> FleetEvaluationResult:
+        """
+        Evaluates a fleet given aligned state columns (one entry per agent).
+        A missing alignment column falls back to the single-agent engine default.
+        """
+        n = len(agent_ids)
+        if len(performance) != n:
+            raise ValueError("performance must have one entry per agent.")
+        alignment = alignment if alignment is not None else array('d', [DEFAULT_ALIGNMENT]) * n
+        if len(alignment) != n:
+            raise ValueError("alignment must have one entry per agent.")
+
+        base_seed = self.seed if self.seed is not None else random.randrange(2 ** 32)
+        bounds = [(start, min(start + self.chunk_size, n)) for start in range(0, n, self.chunk_size)]
+
+        if self.workers > 1 and len(bounds) > 1:
+            columns = self._shared_columns_for(n)
+            columns["performance"][:n] = _as_doubles(performance)
+            columns["alignment"][:n] = _as_doubles(alignment)
+            tasks = [
+                (self._shared.name, self._shared_capacity, start, stop, base_seed + chunk_index,
+                 self.min_stability, self.max_risk)
+                for chunk_index, (start, stop) in enumerate(bounds)
+            ]
+            list(self._get_pool().map(_evaluate_shared_chunk, tasks))
+            results = []
+            for name in _RESULT_COLUMNS:
+                column = array(columns[name].format)
+                column.frombytes(columns[name][:n].cast("B"))
+                results.append(column)
+            return FleetEvaluationResult(agent_ids, tuple(results))
+
+        columns = {
+            "performance": performance, "alignment": alignment,
+            "scores": array('d', bytes(8 * n)), "proposals": array('b', bytes(n)),
+            "gains": array('d', bytes(8 * n)), "stabilities": array('d', bytes(8 * n)),
+            "risks": array('d', bytes(8 * n)), "modified": array('b', bytes(n)),
+        }
+        for chunk_index, (start, stop) in enumerate(bounds):
+            _evaluate_fleet_range(columns, start, stop, base_seed + chunk_index,
+                                  self.min_stability, self.max_risk)
+        return FleetEvaluationResult(agent_ids, tuple(columns[name] for name in _RESULT_COLUMNS))
+
+    def run_states(self, states: Dict[str, Dict[str, Any]]) -> FleetEvaluationResult:
+        """
+        Convenience wrapper taking the same per-agent state dicts as ``self_evaluate``,
+        keyed by agent ID.
+        """
+        agent_ids = list(states)
+        performance = array('d', (states[a].get("performance", DEFAULT_PERFORMANCE) for a in agent_ids))
+        alignment = array('d', (states[a].get("alignment", DEFAULT_ALIGNMENT) for a in agent_ids))
+        return self.run(agent_ids, performance, alignment)
+
+    def _get_pool(self):
+        if self._pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _shared_columns_for(self, n: int) -> Dict[str, memoryview]:
+        """Returns the shared column views, growing the buffer (by doubling) if ``n`` agents don't fit."""
+        if n > self._shared_capacity:
+            from multiprocessing import shared_memory
+            self._release_shared()
+            capacity = max(n, 2 * self._shared_capacity)
+            row_size = sum(_ITEMSIZE[typecode] for _, typecode in _SHARED_COLUMNS)
+            self._shared = shared_memory.SharedMemory(create=True, size=capacity * row_size)
+            self._shared_capacity = capacity
+            self._columns = _shared_columns(self._shared.buf, capacity)
+        return self._columns
+
+    def _release_shared(self):
+        if self._shared is not None:
+            for view in self._columns.values():
+                view.release()
+            self._columns = {}
+            self._shared.close()
+            self._shared.unlink()
+            self._shared, self._shared_capacity = None, 0
+
+    def close(self):
+        """Stops the worker pool and frees the shared buffer. The pipeline can still be used afterwards."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self._release_shared()
@@ -0,0 +1,270 @@
+# eidos/core/semantic_index.py
+
+import heapq
+import itertools
+import math
+import random
+import re
+import zlib
+from array import array
+from typing import Any, Dict, List, Sequence, Set, Tuple
+
+_TOKEN_PATTERN = re.compile(r"\w+") # Unicode-aware: non-Latin scripts tokenize too
+_PROBE_BITS = 8 # Lowest-margin key bits considered when building multi-probe masks
+
+
+class HashingVectorizer:
+    """
+    Offline feature-hashing embedder for meme content.
+    Word unigrams and bigrams are hashed (with a stable CRC32, so vectors are identical across
+    processes) into a fixed number of signed buckets and L2-normalized.
+    Any object with a ``dim`` attribute and an ``embed(content)`` method can be used instead.
+    """
+    def __init__(self, dim: int = 128, use_bigrams: bool = True):
+        self.dim = dim
+        self.use_bigrams = use_bigrams
+
+    def embed(self, content: Any) -> array:
+        """Returns the normalized embedding of ``content`` as a float array of length ``dim``."""
+        vector = array('f', bytes(4 * self.dim))
+        tokens = _TOKEN_PATTERN.findall(str(content).lower())
+        features = tokens
+        if self.use_bigrams:
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        touched = set()
+        for feature in features:
+            hashed = zlib.crc32(feature.encode("utf-8"))
+            bucket = hashed % self.dim
+            vector[bucket] += 1.0 if hashed & 0x80000000 else -1.0
+            touched.add(bucket)
+        norm = math.sqrt(sum(vector[i] * vector[i] for i in touched))
+        if norm:
+            for i in touched: # Only touched buckets can be non-zero
+                vector[i] /= norm
+        return vector
+
+
+def _sparse(vector: Sequence[float]) -> List[Tuple[int, float]]:
+    """Non-zero (index, value) pairs of a dense vector."""
+    return [(i, value) for i, value in enumerate(vector) if value]
+
+
+class SemanticMemeIndex:
+    """
+    Approximate nearest-neighbor index over MemeUnit™ content for the Memetic Kernel™.
+    Embeddings live in one contiguous float32 matrix (one row per slot, freed slots are reused),
+    and random-hyperplane LSH tables map each row to a bucket per table.
+
+    Buckets are keyed by a ``bits``-bit code per table, and ``bits`` grows with the pool (about
+    log2(len / bucket_size), up to ``max_bits``) so buckets stay around ``bucket_size`` memes.
+    When the pool doubles, every stored code is extended by one bit from the stored embedding
+    rows (nothing is re-embedded) and the buckets are rebuilt. Queries probe their own bucket plus the ``probes`` neighbor
+    buckets (one- and two-bit flips of the key bits whose hyperplanes the query lies closest to)
+    and re-rank those candidates exactly. The number of memes scored per query therefore stays
+    roughly constant as the pool grows instead of being a fixed share of it; in exchange recall
+    slowly drops for very large pools, which more ``probes`` or ``tables`` win back.
+    Pools no larger than ``exact_threshold`` are simply scanned.
+
+    Adding a meme (embedding plus hashing) costs on the order of 100 µs. Memes whose content changed can be
+    passed to ``mark_stale``; they are re-embedded in one batch before the next query,
+    so a meme mutated over several evolution steps is only re-embedded once.
+    """
+    def __init__(self, embedder: Any = None, tables: int = 12, bucket_size: int = 32,
+                 min_bits: int = 8, max_bits: int = 16, probes: int = 16,
+                 exact_threshold: int = 1000, seed: int = 0):
+        self.embedder = embedder if embedder is not None else HashingVectorizer()
+        self.dim = self.embedder.dim
+        self.tables = tables
+        self.bucket_size = bucket_size
+        self.min_bits = min_bits
+        self.max_bits = max_bits
+        self.bits = min_bits # Current bucket key length, grows with the pool
+        self.probes = probes
+        self.exact_threshold = exact_threshold
+        self.last_candidate_count = 0 # Memes scored by the most recent query
+
+        # Hyperplanes stored per dimension so a sparse vector only touches the rows it uses.
+        # Each row is bit-major (bit * tables + table), so the planes for the first ``bits``
+        # bits of every table are a prefix of the row.
+        rng = random.Random(seed)
+        self._planes_by_dim = [[rng.gauss(0.0, 1.0) for _ in range(tables * max_bits)] for _ in range(self.dim)]
+
+        self.vectors = array('f') # Contiguous embedding matrix, row-major (slot * dim)
+        self._memes: List[Any] = [] # Slot -> MemeUnit™ (None for free slots)
+        self._codes: List[Tuple[int, ...]] = [] # Slot -> bits-long code per table
+        self._slots: Dict[Any, int] = {} # MemeUnit™ -> slot
+        self._free: List[int] = []
+        self._buckets: List[Dict[int, Set[int]]] = [{} for _ in range(tables)]
+        self._stale: Dict[Any, None] = {} # Indexed memes waiting to be re-embedded
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, meme: Any) -> bool:
+        return meme in self._slots
+
+    def _projections(self, sparse: List[Tuple[int, float]]) -> List[float]:
+        """Projections onto the hyperplanes of the current ``bits`` of every table (bit-major)."""
+        projections = [0.0] * (self.bits * self.tables)
+        planes = self._planes_by_dim
+        for i, value in sparse:
+            projections = [total + weight * value for total, weight in zip(projections, planes[i])]
+        return projections
+
+    def _codes_for(self, projections: List[float]) -> Tuple[int, ...]:
+        codes = []
+        for table in range(self.tables):
+            code = 0
+            for k in range(table, self.bits * self.tables, self.tables):
+                code = (code << 1) | (projections[k] > 0.0)
+            codes.append(code)
+        return tuple(codes)
+
+    def _insert(self, slot: int, codes: Tuple[int, ...]):
+        for table, code in enumerate(codes):
+            bucket = self._buckets[table].get(code)
+            if bucket is None:
+                self._buckets[table][code] = {slot}
+            else:
+                bucket.add(slot)
+
+    def _grow_codes(self):
+        """Extends every stored code by one bit (from the stored embeddings) and rebuilds the buckets."""
+        first = self.bits * self.tables
+        planes = self._planes_by_dim
+        for slot in self._slots.values():
+            base = slot * self.dim
+            projections = [0.0] * self.tables
+            for i, value in _sparse(self.vectors[base:base + self.dim]):
+                weights = planes[i]
+                projections = [total + weights[first + table] * value for table, total in enumerate(projections)]
+            self._codes[slot] = tuple(
+                (code << 1) | (projection > 0.0) for code, projection in zip(self._codes[slot], projections)
+            )
+        self.bits += 1
+        self._buckets = [{} for _ in range(self.tables)]
+        for slot in self._slots.values():
+            self._insert(slot, self._codes[slot])
+
+    def add(self, meme: Any):
+        """Embeds and indexes a meme; re-adding an indexed meme refreshes it."""
+        if meme in self._slots:
+            self.remove(meme)
+        vector = self.embedder.embed(meme.content)
+        codes = self._codes_for(self._projections(_sparse(vector)))
+
+        if self._free:
+            slot = self._free.pop()
+            self.vectors[slot * self.dim:(slot + 1) * self.dim] = array('f', vector)
+            self._memes[slot] = meme
+            self._codes[slot] = codes
+        else:
+            slot = len(self._memes)
+            self.vectors.extend(array('f', vector))
+            self._memes.append(meme)
+            self._codes.append(codes)
+
+        self._slots[meme] = slot
+        self._insert(slot, codes)
+        if self.bits < self.max_bits and len(self._slots) > self.bucket_size << self.bits:
+            self._grow_codes() # Pool doubled: one more bit keeps buckets at bucket_size
+
+    def update(self, meme: Any):
+        """Re-embeds a meme whose content changed (e.g. after mutation)."""
+        self.add(meme)
+
+    def mark_stale(self, meme: Any):
+        """Defers re-embedding a changed meme until the next query (or ``refresh``)."""
+        if meme in self._slots:
+            self._stale[meme] = None
+
+    def refresh(self):
+        """Re-embeds every meme marked stale."""
+        stale, self._stale = self._stale, {}
+        for meme in stale:
+            if meme in self._slots:
+                self.add(meme)
+
+    def remove(self, meme: Any):
+        """Drops a meme from the index; unknown memes are ignored."""
+        slot = self._slots.pop(meme, None)
+        if slot is None:
+            return
+        self._stale.pop(meme, None)
+        for table, code in enumerate(self._codes[slot]):
+            bucket = self._buckets[table][code]
+            bucket.discard(slot)
+            if not bucket:
+                del self._buckets[table][code]
+        self._memes[slot] = None
+        self._free.append(slot)
+
+    def _similarity(self, sparse_query: List[Tuple[int, float]], slot: int) -> float:
+        vectors, base = self.vectors, slot * self.dim
+        return sum(vectors[base + i] * value for i, value in sparse_query)
+
+    def _candidates(self, projections: List[float]) -> Set[int]:
+        candidates = set()
+        for table, code in enumerate(self._codes_for(projections)):
+            buckets = self._buckets[table]
+            bucket = buckets.get(code)
+            if bucket:
+                candidates.update(bucket)
+            for mask in self._probe_masks(projections, table):
+                bucket = buckets.get(code ^ mask)
+                if bucket:
+                    candidates.update(bucket)
+        return candidates
+
+    def _probe_masks(self, projections: List[float], table: int) -> List[int]:
+        """
+        Multi-probe: XOR masks for the ``probes`` neighbor buckets of one table most likely to hold
+        near neighbors, i.e. flips of the key bits whose hyperplanes the query lies closest to.
+        """
+        margins = heapq.nsmallest(_PROBE_BITS, (
+            (abs(projections[j * self.tables + table]), 1 << (self.bits - 1 - j)) for j in range(self.bits)
+        ))
+        flips = margins + [(m1 + m2, b1 | b2) for (m1, b1), (m2, b2) in itertools.combinations(margins, 2)]
+        return [mask for _, mask in heapq.nsmallest(self.probes, flips)]
+
+    def _rank(self, sparse_query: List[Tuple[int, float]], slots, count: int,
+              fitness_weight: float) -> List[Tuple[float, Any]]:
+        scored = []
+        for slot in slots:
+            meme = self._memes[slot]
+            similarity = self._similarity(sparse_query, slot)
+            scored.append((similarity + fitness_weight * meme.fitness, slot, meme))
+        return [(score, meme) for score, _, meme in heapq.nlargest(count, scored, key=lambda entry: entry[0])]
+
+    def _by_fitness(self, count: int, fitness_weight: float) -> List[Tuple[float, Any]]:
+        """Fallback for queries with no features: the fittest memes, scored by fitness alone."""
+        fittest = heapq.nlargest(count, self._slots, key=lambda meme: meme.fitness)
+        return [(fitness_weight * meme.fitness, meme) for meme in fittest]
+
+    def search(self, query: Any, count: int = 1, fitness_weight: float = 0.0) -> List[Tuple[float, Any]]:
+        """
+        Returns up to ``count`` (score, meme) pairs ranked by cosine similarity to ``query``
+        plus ``fitness_weight`` times the meme's fitness. Only LSH candidates are scored.
+        A query with no features (e.g. only punctuation) returns the fittest memes instead.
+        """
+        if self._stale:
+            self.refresh()
+        sparse_query = _sparse(self.embedder.embed(query))
+        if not sparse_query:
+            self.last_candidate_count = len(self._slots)
+            return self._by_fitness(count, fitness_weight)
+        if len(self._slots) <= self.exact_threshold:
+            self.last_candidate_count = len(self._slots)
+            return self._rank(sparse_query, self._slots.values(), count, fitness_weight)
+        candidates = self._candidates(self._projections(sparse_query))
+        self.last_candidate_count = len(candidates)
+        return self._rank(sparse_query, candidates, count, fitness_weight)
+
+    def exact_search(self, query: Any, count: int = 1, fitness_weight: float = 0.0) -> List[Tuple[float, Any]]:
+        """Brute-force version of ``search`` over every indexed meme (for recall measurements)."""
+        if self._stale:
+            self.refresh()
+        sparse_query = _sparse(self.embedder.embed(query))
+        if not sparse_query:
+            return self._by_fitness(count, fitness_weight)
+        return self._rank(sparse_query, self._slots.values(), count, fitness_weight)
@@ -0,0 +1,26 @@
+# eidos/protocol/__init__.py
+"""Swarm Protocol™ components. Names are loaded lazily on first use."""
+
+from eidos import _LAZY_ATTRIBUTES as _PACKAGE_ATTRIBUTES
+
+# Subset of the package-wide name -> module table defined in this subpackage.
+_LAZY_ATTRIBUTES = {
+    name: module_name for name, module_name in _PACKAGE_ATTRIBUTES.items()
+    if module_name.startswith("eidos.protocol.")
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,108 @@
+# eidos/protocol/meme_propagation.py
+
+import random
+import time
+from typing import Any, Dict, List
+
+from eidos.core.instrumentation import instrumented, metrics
+
+
+class MemePropagator:
+    """
+    Moves memes between agents' Memetic Kernels™ over the Swarm Protocol™.
+    Each round, every participating kernel picks a small batch of high-fitness memes by
+    tournament selection weighted by ``propagation_bias`` and sends it to a few random peers
+    as a ``message_type`` ("meme_batch" by default) message through ``swarm.send_message``;
+    the propagator registers the handler that has the recipient's kernel adopt the batch, so
+    several propagators on one swarm need distinct message types.
+    Memes travel as lightweight shares (content by reference), and selection only looks at
+    sampled memes, so the cost of a round depends on how many memes move, not on pool sizes.
+    """
+    def __init__(self, swarm: Any, kernels: Dict[str, Any], batch_size: int = 8,
+                 fanout: int = 2, tournament_size: int = 4, seed: int = None,
+                 message_type: str = "meme_batch"):
+        self.swarm = swarm
+        self.kernels = kernels # Agent ID -> that agent's MemeticKernel
+        self.batch_size = batch_size
+        self.fanout = fanout
+        self.tournament_size = tournament_size
+        self.rng = random.Random(seed)
+        self.message_type = message_type
+
+        self.rounds = 0
+        self.batches_sent = 0
+        self.memes_sent = 0
+        self.memes_adopted = 0
+        self.round_seconds = 0.0
+        self.started_at = time.monotonic()
+        swarm.on_message(message_type, self._receive_batch)
+
+    def _receive_batch(self, recipient_id: str, message: Dict[str, Any]) -> int:
+        """Swarm message handler: the recipient's kernel adopts the batch. Returns the adopted count."""
+        kernel = self.kernels.get(recipient_id)
+        return kernel.adopt(message["payload"]) if kernel is not None else 0
+
+    def select_memes(self, kernel: Any) -> List[Any]:
+        """Tournament-selects up to ``batch_size`` distinct memes, favoring fitness * propagation_bias."""
+        pool = kernel.meme_pool
+        if not pool:
+            return []
+        randrange = self.rng.randrange
+        selected = {}
+        for _ in range(min(self.batch_size, len(pool))):
+            best = pool[randrange(len(pool))]
+            for _ in range(self.tournament_size - 1):
+                challenger = pool[randrange(len(pool))]
+                if challenger.fitness * challenger.propagation_bias > best.fitness * best.propagation_bias:
+                    best = challenger
+            selected[id(best)] = best
+        return list(selected.values())
+
+    @instrumented("MemePropagator.propagate_round")
+    def propagate_round(self) -> Dict[str, int]:
+        """Runs one propagation round across the swarm and returns its transfer counts."""
+        start = time.perf_counter()
+        participants = [(agent.id, self.kernels[agent.id]) for agent in self.swarm.agents if agent.id in self.kernels]
+        sent = adopted = batches = 0
+
+        if len(participants) > 1:
+            fanout = min(self.fanout, len(participants) - 1)
+            for index, (agent_id, kernel) in enumerate(participants):
+                batch = self.select_memes(kernel)
+                if not batch:
+                    continue
+                kernel.mark_shared(batch) # The sender already knows what it sends, so echoes are dropped
+
+                # Pick distinct peers other than the sender without scanning the participant list.
+                peer_indexes = self.rng.sample(range(len(participants) - 1), fanout)
+                for peer_index in peer_indexes:
+                    peer_id, _ = participants[peer_index + 1 if peer_index >= index else peer_index]
+                    adopted += self.swarm.send_message(agent_id, peer_id, self.message_type, [meme.share() for meme in batch])
+                    sent += len(batch)
+                    batches += 1
+
+        self.rounds += 1
+        self.batches_sent += batches
+        self.memes_sent += sent
+        self.memes_adopted += adopted
+        self.round_seconds += time.perf_counter() - start
+        metrics.increment("propagation.memes_sent", sent)
+        metrics.increment("propagation.memes_adopted", adopted)
+        return {"round": self.rounds, "batches": batches, "memes_sent": sent, "memes_adopted": adopted}
+
+    def attach(self, scheduler: Any, interval: float) -> int:
+        """Runs a propagation round every ``interval`` seconds (must be positive) on a SwarmScheduler. Returns the handle."""
+        return scheduler.schedule(interval, self.propagate_round, interval=interval)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns transfer volume and rates since the propagator was created."""
+        elapsed = time.monotonic() - self.started_at
+        return {
+            "rounds": self.rounds,
+            "batches_sent": self.batches_sent,
+            "memes_sent": self.memes_sent,
+            "memes_adopted": self.memes_adopted,
+            "memes_per_round": self.memes_sent / self.rounds if self.rounds else 0.0,
+            "memes_per_second": self.memes_sent / elapsed if elapsed else 0.0,
+            "transfer_throughput": self.memes_sent / self.round_seconds if self.round_seconds else 0.0 # memes per second spent propagating
+        }
@@ -1,12 +1,12 @@
 # eidos/protocol/swarm_protocol.py <-- Note the conceptual path change
 
-from typing import List, Dict, Any, Tuple
-import random
-import time
+from typing import TYPE_CHECKING, List, Dict, Any, Callable, Tuple
 from datetime import datetime
 
-# --- UPDATED IMPORT PATH ---
-from eidos.core.agent_spawner import Agent 
+from eidos.core.instrumentation import instrumented
+
+if TYPE_CHECKING: # Agent is only needed for annotations; skip importing the spawner/kernel at runtime
+    from eidos.core.agent_spawner import Agent
 
 
 class SwarmProtocol:
@@ -15,12 +15,15 @@ class SwarmProtocol:
     Manages coordination, consensus, and synchronization among a group of agents.
     This is your protocol-level crown jewel for decentralized AGI governance.
     """
-    def __init__(self, swarm_id: str, agents: List[Agent]):
+    def __init__(self, swarm_id: str, agents: List['Agent']):
         self.swarm_id = swarm_id
         self.agents = agents
         self.consensus_history = []
+        self.event_log = None # Optional EventLog recording consensus outcomes
+        self.message_handlers: Dict[str, Callable[[str, Dict[str, Any]], Any]] = {} # Message type -> handler
         print(f"SwarmProtocol™ initialized for Swarm ID: {self.swarm_id} with {len(self.agents)} agents.")
 
+    @instrumented("SwarmProtocol.broadcast_message")
     def broadcast_message(self, sender_id: str, message_type: str, payload: Any):
         """
         Broadcasts a message from a sender to all agents in the swarm.
@@ -32,10 +35,39 @@ class SwarmProtocol:
             "timestamp": datetime.now().isoformat()
         }
         print(f"SwarmProtocol™: Agent {sender_id[:4]} broadcasting '{message_type}'...")
-        for agent in self.agents:
-            if agent.id != sender_id: # Agent doesn't send message to itself
-                agent.receive_message(message) # Assuming agent has receive_message method
+        self._deliver(sender_id, message)
 
+    @instrumented("SwarmProtocol.send_message")
+    def send_message(self, sender_id: str, recipient_id: str, message_type: str, payload: Any) -> Any:
+        """
+        Sends a message from one agent to another agent in the swarm.
+        Messages whose type has a handler registered with ``on_message`` are passed to it
+        (and its result returned); anything else lands in the recipient's inbox.
+        """
+        message = {
+            "sender_id": sender_id,
+            "recipient_id": recipient_id,
+            "type": message_type,
+            "payload": payload,
+            "timestamp": datetime.now().isoformat()
+        }
+        # No console output here: point-to-point traffic (e.g. meme propagation) is high-volume.
+        handler = self.message_handlers.get(message_type)
+        if handler is not None:
+            return handler(recipient_id, message)
+        self._deliver_to(recipient_id, message)
+        return None
+
+    def on_message(self, message_type: str, handler: Callable[[str, Dict[str, Any]], Any]):
+        """
+        Registers ``handler(recipient_id, message)`` for point-to-point messages of ``message_type``.
+        Each type has a single handler; registering a second one raises ValueError.
+        """
+        if message_type in self.message_handlers:
+            raise ValueError(f"Swarm {self.swarm_id} already has a handler for '{message_type}' messages.")
+        self.message_handlers[message_type] = handler
+
+    @instrumented("SwarmProtocol.achieve_consensus")
     def achieve_consensus(self, topic: str, method: str = "majority_vote") -> Tuple[Any, bool]:
         """
         Attempts to achieve consensus among swarm agents on a given topic.
@@ -46,7 +78,7 @@ class SwarmProtocol:
             return None, False
 
         # Ensure agents have a local_belief attribute for consensus.
-        beliefs = [agent.express_belief() for agent in self.agents if agent.express_belief() is not None]
+        beliefs = self._collect_beliefs()
 
         if not beliefs:
             print("SwarmProtocol™: No beliefs expressed for consensus.")
@@ -81,27 +113,52 @@ class SwarmProtocol:
             "consensus_reached": consensus_reached,
             "timestamp": datetime.now().isoformat()
         })
+        if self.event_log is not None:
+            self.event_log.emit("consensus", self.swarm_id, self.consensus_history[-1])
 
         if consensus_reached:
             print(f"SwarmProtocol™: Consensus reached on '{topic}': {agreed_value}")
             # Update all agents' beliefs to the consensus (synchronization)
-            for agent in self.agents:
-                agent.update_belief(agreed_value)
+            self._apply_belief(agreed_value)
         else:
             print(f"SwarmProtocol™: No consensus reached on '{topic}'.")
 
         return agreed_value, consensus_reached
 
+    @instrumented("SwarmProtocol.synchronize_agents")
     def synchronize_agents(self, data: Any):
         """
         Synchronizes agents with common data or state.
         This is a synchronization mechanism within the Swarm Protocol™.
         """
         print(f"SwarmProtocol™: Synchronizing agents with data: {str(data)[:50]}...")
-        for agent in self.agents:
-            agent.update_belief(data) # Simple update to simulate synchronization
+        self._apply_belief(data) # Simple update to simulate synchronization
         print("SwarmProtocol™: Agents synchronized.")
 
+    # Agent access hooks; a runtime that hosts agents elsewhere overrides these.
+    def _deliver(self, sender_id: str, message: Dict[str, Any]):
+        """Delivers a message to every agent except its sender."""
+        for agent in self.agents:
+            if agent.id != sender_id: # Agent doesn't send message to itself
+                agent.receive_message(message)
+
+    def _deliver_to(self, recipient_id: str, message: Dict[str, Any]):
+        """Delivers a message to a single agent."""
+        for agent in self.agents:
+            if agent.id == recipient_id:
+                agent.receive_message(message)
+                return
+        raise ValueError(f"Agent {recipient_id} is not a member of swarm {self.swarm_id}.")
+
+    def _collect_beliefs(self) -> List[Any]:
+        """Gathers the non-empty beliefs expressed by the swarm's agents."""
+        return [belief for belief in (agent.express_belief() for agent in self.agents) if belief is not None]
+
+    def _apply_belief(self, belief: Any):
+        """Sets every agent's local belief."""
+        for agent in self.agents:
+            agent.update_belief(belief)
+
     def get_swarm_status(self):
         """Returns the current status of the swarm."""
         return {
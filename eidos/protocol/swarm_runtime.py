@@ -0,0 +1,237 @@
+# eidos/protocol/swarm_runtime.py
+
+import copy
+import pickle
+from typing import Any, Dict, List
+
+from eidos.protocol.swarm_protocol import SwarmProtocol
+
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+def _worker_main(connection, agents: List[Any]):
+    """
+    Worker process loop. Hosts a group of agents and applies batches of commands sent by the
+    coordinating DistributedSwarmProtocol; replies with one batch per request that needs answers.
+    Commands addressed to a single agent are ignored by the workers that don't host it.
+    """
+    by_id = {agent.id: agent for agent in agents}
+    while True:
+        commands = pickle.loads(connection.recv_bytes())
+        replies = []
+        for command in commands:
+            kind = command[0]
+            if kind == "deliver":
+                _, sender_id, message = command
+                for agent in agents:
+                    if agent.id != sender_id:
+                        agent.receive_message(message)
+            elif kind == "set_belief":
+                for agent in agents:
+                    agent.update_belief(command[1])
+            elif kind == "agent":
+                _, agent_id, field, value = command
+                agent = by_id.get(agent_id)
+                if agent is None:
+                    continue
+                if field == "belief":
+                    agent.update_belief(value)
+                elif field == "status":
+                    agent.status = value # Set directly: update_status would print from the worker
+                elif field == "message":
+                    agent.receive_message(value)
+            elif kind == "beliefs":
+                replies.append([belief for belief in (agent.express_belief() for agent in agents) if belief is not None])
+            elif kind == "state":
+                replies.append({agent.id: (agent.local_belief, agent.status, agent.inbox) for agent in agents})
+            elif kind == "stop":
+                connection.close()
+                return
+        if replies:
+            connection.send_bytes(pickle.dumps(replies, _PICKLE_PROTOCOL))
+
+
+class DistributedSwarmProtocol(SwarmProtocol):
+    """
+    Multi-process runtime for the Swarm Protocol™.
+    Agents are split across worker processes and reached over local pipes (Unix domain sockets
+    on POSIX). Every swarm operation addresses all agents, so commands are buffered once,
+    pickled once per batch and the same bytes are written to each worker; consensus gathers
+    beliefs from all workers in parallel. The SwarmProtocol API is unchanged.
+
+    While the runtime is open the workers own agent state. The local Agent objects stay usable:
+    ``update_belief``, ``update_status`` and ``receive_message`` on a member agent are forwarded
+    to its worker, consensus and synchronization results are mirrored onto the local beliefs,
+    and watched agents are marked dirty on their SwarmScheduler as usual. Inboxes are only
+    copied back by ``pull_state`` (called by ``close``). Assigning agent attributes directly
+    while the runtime is open is not supported; ``pull_state`` raises rather than overwrite such
+    changes. A closed runtime raises on any swarm operation.
+    """
+    def __init__(self, swarm_id: str, agents: List[Any], workers: int = 2,
+                 batch_size: int = 256, start_method: str = None):
+        for agent in agents:
+            if agent.runtime is not None:
+                raise ValueError(f"Agent {agent.id} is already hosted by swarm runtime '{agent.runtime.swarm_id}'.")
+        super().__init__(swarm_id, agents)
+        import multiprocessing
+        context = multiprocessing.get_context(start_method)
+        self.batch_size = batch_size # Buffered commands before an automatic flush
+        self._connections = []
+        self._processes = []
+        self._pending: List[tuple] = []
+        self._agents_by_id = {agent.id: agent for agent in agents}
+        self._synced: Dict[str, list] = {} # Agent ID -> [belief, status, inbox, inbox length] as last synced
+        self._watched = None # Member agents with a scheduler, cached until the next flush
+
+        workers = max(1, min(workers, len(agents))) if agents else 1
+        for worker_index in range(workers):
+            group = []
+            for agent in agents[worker_index::workers]:
+                portable = copy.copy(agent)
+                portable.scheduler = None # Schedulers and event logs stay in the coordinating process
+                portable.event_log = None
+                group.append(portable)
+            parent_connection, child_connection = context.Pipe()
+            process = context.Process(target=_worker_main, args=(child_connection, group), daemon=True)
+            process.start()
+            child_connection.close()
+            self._connections.append(parent_connection)
+            self._processes.append(process)
+
+        for agent in agents:
+            self._synced[agent.id] = [agent.local_belief, agent.status, agent.inbox, len(agent.inbox)]
+            agent.runtime = self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def worker_count(self) -> int:
+        return len(self._processes)
+
+    @property
+    def closed(self) -> bool:
+        return not self._processes
+
+    def _check_open(self):
+        if not self._processes:
+            raise RuntimeError(f"DistributedSwarmProtocol '{self.swarm_id}' is closed.")
+
+    def _enqueue(self, command: tuple):
+        self._check_open()
+        self._pending.append(command)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Sends all buffered commands to the workers."""
+        if self._pending:
+            payload = pickle.dumps(self._pending, _PICKLE_PROTOCOL)
+            for connection in self._connections:
+                connection.send_bytes(payload)
+            self._pending = []
+        self._watched = None
+
+    def _watched_agents(self) -> List[Any]:
+        if self._watched is None:
+            self._watched = [agent for agent in self.agents if agent.scheduler is not None]
+        return self._watched
+
+    def _request(self, command: tuple) -> List[Any]:
+        """Sends ``command`` to every worker (after any buffered work) and gathers one reply from each."""
+        self._check_open()
+        self._pending.append(command)
+        self.flush()
+        return [pickle.loads(connection.recv_bytes())[-1] for connection in self._connections]
+
+    def forward(self, agent: Any, field: str, value: Any):
+        """
+        Called by a member Agent when its belief, status or inbox changes locally; sends the
+        change to the worker that owns the agent's state.
+        """
+        self._enqueue(("agent", agent.id, field, value))
+        synced = self._synced[agent.id]
+        if field == "belief":
+            synced[0] = value
+        elif field == "status":
+            synced[1] = value
+        elif field == "message":
+            synced[3] += 1
+
+    def _deliver(self, sender_id: str, message: Dict[str, Any]):
+        self._enqueue(("deliver", sender_id, message))
+        for agent in self._watched_agents(): # Workers have no scheduler, so raise the events here
+            if agent.id != sender_id:
+                agent.scheduler.mark_dirty(agent.id, "message")
+
+    def _deliver_to(self, recipient_id: str, message: Dict[str, Any]):
+        agent = self._agents_by_id.get(recipient_id)
+        if agent is None:
+            raise ValueError(f"Agent {recipient_id} is not a member of swarm {self.swarm_id}.")
+        self._enqueue(("agent", recipient_id, "message", message))
+        if agent.scheduler is not None:
+            agent.scheduler.mark_dirty(recipient_id, "message")
+
+    def _collect_beliefs(self) -> List[Any]:
+        beliefs = []
+        for worker_beliefs in self._request(("beliefs",)):
+            beliefs.extend(worker_beliefs)
+        return beliefs
+
+    def _apply_belief(self, belief: Any):
+        self._enqueue(("set_belief", belief))
+        for agent in self.agents: # Mirror the result locally and raise the scheduler events
+            if agent.scheduler is not None and belief != agent.local_belief:
+                agent.scheduler.mark_dirty(agent.id, "belief")
+            agent.local_belief = belief
+            self._synced[agent.id][0] = belief
+        if self.event_log is not None: # Worker-side agents don't log, so record it once here
+            self.event_log.emit("swarm_belief", self.swarm_id, belief)
+
+    def pull_state(self):
+        """
+        Copies beliefs, statuses and inboxes from the workers onto the local Agent objects.
+        Raises RuntimeError, before copying anything, if an agent's state was assigned
+        directly instead of through its update methods since the last sync.
+        """
+        self._check_open()
+        for agent in self.agents:
+            belief, status, inbox, inbox_length = self._synced[agent.id]
+            if agent.local_belief is not belief or agent.status is not status or \
+                    agent.inbox is not inbox or len(agent.inbox) != inbox_length:
+                raise RuntimeError(
+                    f"Agent {agent.id} was modified directly while hosted by DistributedSwarmProtocol "
+                    f"'{self.swarm_id}'; use update_belief, update_status or receive_message instead."
+                )
+        state = {}
+        for worker_state in self._request(("state",)):
+            state.update(worker_state)
+        for agent in self.agents:
+            if agent.id in state:
+                agent.local_belief, agent.status, agent.inbox = state[agent.id]
+                self._synced[agent.id] = [agent.local_belief, agent.status, agent.inbox, len(agent.inbox)]
+
+    def close(self):
+        """Syncs agent state back, then stops the worker processes and releases the agents."""
+        if not self._processes:
+            return
+        try:
+            self.pull_state()
+        finally:
+            self._pending.append(("stop",))
+            self.flush()
+            for connection, process in zip(self._connections, self._processes):
+                process.join()
+                connection.close()
+            self._connections, self._processes = [], []
+            for agent in self.agents:
+                if agent.runtime is self:
+                    agent.runtime = None
+
+    def get_swarm_status(self):
+        status = super().get_swarm_status()
+        status["workers"] = self.worker_count
+        return status
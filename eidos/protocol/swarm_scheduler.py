@@ -0,0 +1,202 @@
+# eidos/protocol/swarm_scheduler.py
+
+import heapq
+import itertools
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Tuple
+from eidos.core.instrumentation import instrumented
+
+
+def _target_id(target: Any) -> str:
+    """Resolves the identifier used for an agent, kernel or swarm."""
+    for attr in ("id", "kernel_id", "swarm_id"):
+        value = getattr(target, attr, None)
+        if value is not None:
+            return value
+    raise ValueError(f"Cannot determine an ID for {target!r}; pass target_id explicitly.")
+
+
+class SwarmScheduler:
+    """
+    Event-driven tick scheduler for the Swarm Protocol™.
+    Watched components mark themselves dirty when their state changes (belief updates,
+    ingested memes, received messages) and each tick only runs the handlers for that work.
+    Timed callbacks are kept in a deadline priority queue, and dirty work is served
+    round-robin with a per-target slice of events so busy agents cannot starve quiet ones.
+    """
+    def __init__(self, events_per_slice: int = 1, max_work_per_tick: int = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.events_per_slice = events_per_slice # Max dirty events (not seconds) handled per target per tick
+        self.max_work_per_tick = max_work_per_tick # Optional cap on handler calls per tick
+        self.clock = clock
+        self.tick_count = 0
+
+        self._targets: Dict[str, Any] = {}
+        self._dependents: Dict[str, List[str]] = {} # e.g. agent ID -> IDs of swarms it belongs to
+        self._handlers: Dict[str, List[Tuple[type, Callable[[Any, str], Any]]]] = {}
+        self._handled: Dict[Tuple[str, type], bool] = {} # (event, target class) -> any handler applies
+        self._dirty: Dict[str, Dict[str, None]] = {} # target ID -> ordered set of pending events
+        self._ready = deque() # Round-robin queue of dirty target IDs
+        self._deadlines: List[Tuple[float, int, Callable, tuple, float]] = []
+        self._scheduled = set() # Handles still in the deadline queue
+        self._cancelled = set()
+        self._sequence = itertools.count()
+
+    def watch(self, target: Any, target_id: str = None) -> str:
+        """
+        Registers an Agent, MemeticKernel or other component with the scheduler.
+        The component will report its own state changes through ``mark_dirty``.
+        """
+        target_id = target_id if target_id is not None else _target_id(target)
+        self._targets[target_id] = target
+        if hasattr(target, "scheduler"):
+            target.scheduler = self
+        return target_id
+
+    def watch_swarm(self, swarm: Any) -> str:
+        """
+        Registers a SwarmProtocol and all of its agents.
+        Events raised by any member agent also mark the swarm itself dirty.
+        """
+        swarm_id = self.watch(swarm, swarm.swarm_id)
+        for agent in swarm.agents:
+            agent_id = self.watch(agent)
+            dependents = self._dependents.setdefault(agent_id, [])
+            if swarm_id not in dependents:
+                dependents.append(swarm_id)
+        return swarm_id
+
+    def unwatch(self, target_id: str):
+        """Stops tracking a component and drops any pending work for it."""
+        target = self._targets.pop(target_id, None)
+        if target is not None and getattr(target, "scheduler", None) is self:
+            target.scheduler = None
+        self._dependents.pop(target_id, None)
+        self._dirty.pop(target_id, None) # Stale IDs left in the ready queue are skipped
+
+    def on(self, event: str, handler: Callable[[Any, str], Any], target_type: type = None):
+        """
+        Registers ``handler(target, event)`` to run when a watched target raises ``event``.
+        If ``target_type`` is given, the handler only runs for targets of that type.
+        """
+        self._handlers.setdefault(event, []).append((target_type, handler))
+        self._handled.clear()
+
+    def _applies(self, event: str, target: Any) -> bool:
+        """Whether any handler for ``event`` runs for targets of this type (cached per class)."""
+        key = (event, type(target))
+        applies = self._handled.get(key)
+        if applies is None:
+            applies = self._handled[key] = any(
+                target_type is None or isinstance(target, target_type)
+                for target_type, _ in self._handlers.get(event, ())
+            )
+        return applies
+
+    def mark_dirty(self, target_id: str, event: str):
+        """
+        Records that ``event`` happened on a watched target; repeated events coalesce.
+        Targets are only queued if a handler for ``event`` applies to their type.
+        """
+        target = self._targets.get(target_id)
+        if target is not None and self._applies(event, target):
+            events = self._dirty.get(target_id)
+            if events is None:
+                self._dirty[target_id] = {event: None}
+                self._ready.append(target_id)
+            else:
+                events[event] = None
+        for dependent_id in self._dependents.get(target_id, ()):
+            self.mark_dirty(dependent_id, event)
+
+    def is_dirty(self, target_id: str) -> bool:
+        """Whether a target has pending work."""
+        return target_id in self._dirty
+
+    def schedule(self, delay: float, callback: Callable, *args, interval: float = None) -> int:
+        """
+        Runs ``callback(*args)`` on the first tick at or after ``delay`` seconds from now.
+        With ``interval`` the callback is re-armed after each run; it must be positive.
+        Returns a handle for ``cancel``.
+        """
+        if interval is not None and interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}.")
+        handle = next(self._sequence)
+        heapq.heappush(self._deadlines, (self.clock() + delay, handle, callback, args, interval))
+        self._scheduled.add(handle)
+        return handle
+
+    def cancel(self, handle: int):
+        """Cancels a scheduled callback; handles that already ran (or are unknown) are ignored."""
+        if handle in self._scheduled:
+            self._cancelled.add(handle)
+
+    def pending(self) -> int:
+        """Number of targets with pending dirty work."""
+        return len(self._dirty)
+
+    @instrumented("SwarmScheduler.tick")
+    def tick(self, now: float = None) -> Dict[str, int]:
+        """
+        Runs one scheduler tick: due deadlines first, then one round-robin pass over dirty targets.
+        Work left over by the per-target slice or the per-tick cap carries over to the next tick.
+        """
+        now = now if now is not None else self.clock()
+        self.tick_count += 1
+        deadlines_run = self._run_deadlines(now)
+
+        handled = 0
+        budget = self.max_work_per_tick
+        for _ in range(len(self._ready)):
+            if budget is not None and handled >= budget:
+                break
+            target_id = self._ready.popleft()
+            events = self._dirty.get(target_id)
+            if events is None: # Unwatched since it was queued
+                continue
+
+            taken = []
+            while events and len(taken) < self.events_per_slice:
+                event = next(iter(events))
+                del events[event]
+                taken.append(event)
+            # Requeue or clear before running handlers so they can re-mark this target.
+            if events:
+                self._ready.append(target_id)
+            else:
+                del self._dirty[target_id]
+
+            target = self._targets[target_id]
+            for event in taken:
+                for target_type, handler in self._handlers.get(event, ()):
+                    if target_type is None or isinstance(target, target_type):
+                        handler(target, event)
+                        handled += 1
+
+        return {
+            "tick": self.tick_count,
+            "handled": handled,
+            "deadlines": deadlines_run,
+            "pending": len(self._dirty)
+        }
+
+    def _run_deadlines(self, now: float) -> int:
+        """Pops and runs every scheduled callback whose deadline has passed."""
+        ran = 0
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, handle, callback, args, interval = heapq.heappop(self._deadlines)
+            if handle in self._cancelled:
+                self._cancelled.discard(handle)
+                self._scheduled.discard(handle)
+                continue
+            if interval is None: # One-shot: forget the handle before running so cancel() is a no-op
+                self._scheduled.discard(handle)
+            callback(*args)
+            ran += 1
+            if interval is not None:
+                next_deadline = deadline + interval
+                if next_deadline <= now: # Skip missed periods instead of running them back to back
+                    next_deadline = now + interval
+                heapq.heappush(self._deadlines, (next_deadline, handle, callback, args, interval))
+        return ran
@@ -4,7 +4,8 @@
 from eidos.core.memetic_kernel import MemeticKernel, MemeUnit
 from eidos.core.agent_spawner import Agent, AgentSpawner
 from eidos.protocol.swarm_protocol import SwarmProtocol
-from eidos.core.recursive_autonomy import RecursiveAutonomyEngine
+from eidos.protocol.swarm_scheduler import SwarmScheduler
+from eidos.core.recursive_autonomy import RecursiveAutonomyEngine, FleetAutonomyPipeline
 from eidos.core.neurostack import Neurostack
 from datetime import datetime
 
@@ -62,6 +63,12 @@ if query_results:
 else:
     print("No memes found for query 'ethical'.")
 
+# Semantic retrieval ranks by embedding similarity combined with fitness
+print("\n--- Retrieving Memes by Semantic Similarity ---")
+semantic_results = kernel.retrieve_memes(query="ethics of AGI governance", count=3, mode="semantic")
+for meme in semantic_results:
+    print(f"- {meme}")
+
 
 print("\n--- Eidos SDK Test Complete ---") # UPDATED BRANDING
 
@@ -131,6 +138,15 @@ agreed_value_unanimous, consensus_reached_unanimous = swarm.achieve_consensus(to
 print(f"Unanimous Consensus Result: Value='{agreed_value_unanimous}', Reached={consensus_reached_unanimous}")
 
 
+# Event-driven scheduling: only agents/swarms whose state changed get work each tick
+print("\n--- Testing Swarm Scheduler ---")
+scheduler = SwarmScheduler(events_per_slice=1)
+scheduler.watch_swarm(swarm)
+scheduler.on("belief", lambda target, event: target.achieve_consensus(topic="Belief Change", method="majority_vote"), SwarmProtocol)
+print(f"Idle tick: {scheduler.tick()}")
+swarm_agent3.update_belief("decision_gamma") # Marks agent 3 (and its swarm) dirty
+print(f"Tick after belief change: {scheduler.tick()}")
+
 # Synchronize agents with a new state
 print("\n--- Synchronizing Agents ---")
 new_global_state = {"timestamp": datetime.now().isoformat(), "status": "all_clear_alpha_protocol"}
@@ -174,6 +190,18 @@ if simulated_impact["predicted_alignment_stability"] > 0.9 and simulated_impact[
 else:
     print("\nConditions not met: Deferring self-modification due to risk or low benefit.")
 
+# Fleet-level pipeline: evaluate many agents at once from column arrays of state
+print("\n--- Testing Fleet Recursive Autonomy™ ---")
+fleet_pipeline = FleetAutonomyPipeline(min_stability=0.9, max_risk=0.05, seed=42)
+fleet_result = fleet_pipeline.run_states({
+    agent1.id: {"performance": 0.85, "alignment": 0.92},
+    agent2.id: {"performance": 0.60, "alignment": 0.95},
+    agent3.id: {"performance": 0.90, "alignment": 0.70},
+})
+print(f"Fleet Result: {fleet_result}")
+for i in range(len(fleet_result)):
+    print(f"- {fleet_result.get(i)}")
+
 print("\n--- Recursive Autonomy™ Test Complete ---")
 
 
@@ -208,3 +236,22 @@ integrated_representation = neurostack.integrate_sensory_input(sensory_data)
 print(f"Integrated Sensory Representation: {integrated_representation}")
 
 print("\n--- Neurostack™ Test Complete ---")
+
+
+# --- Test Instrumentation ---
+print("\n--- Testing Instrumentation ---")
+from eidos.core.instrumentation import metrics
+
+# Trace one swarm tick end to end (metrics are collected inside the block even while disabled)
+with metrics.trace("swarm_tick") as tick_trace:
+    kernel.ingest("Telemetry from the instrumented tick.")
+    kernel.evolve_step()
+    swarm.achieve_consensus(topic="Instrumented Decision", method="unanimous_vote")
+    neurostack.simulate_cognition("Review tick telemetry", complexity=0.3)
+
+print(f"Tick Trace: {tick_trace}")
+for span in tick_trace.as_dict()["spans"]:
+    print(f"- {span['operation']}: {span['duration_seconds'] * 1000:.3f} ms")
+print(f"Metrics Snapshot Operations: {list(metrics.snapshot()['operations'])}")
+
+print("\n--- Instrumentation Test Complete ---")
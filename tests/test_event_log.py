@@ -0,0 +1,115 @@
+# tests/test_event_log.py
+
+import random
+
+import pytest
+
+from eidos.core.agent_spawner import AgentSpawner
+from eidos.core.event_log import MAGIC, EventLog, read_events, replay
+from eidos.core.memetic_kernel import MemeticKernel
+from eidos.protocol.meme_propagation import MemePropagator
+from eidos.protocol.swarm_protocol import SwarmProtocol
+
+
+def _meme_states(kernel):
+    return [(meme.meme_id, meme.origin, meme.content, meme.fitness, meme.lineage) for meme in kernel.meme_pool]
+
+
+def _assert_matches(state, kernels, spawner, swarm):
+    for kernel in kernels:
+        replayed = state.kernels[kernel.kernel_id]
+        assert _meme_states(replayed) == _meme_states(kernel)
+        assert replayed.history == kernel.history
+        assert replayed.known_origins == kernel.known_origins
+    for agent in swarm.agents:
+        replayed = state.agents[agent.id]
+        assert (replayed.local_belief, replayed.status, replayed.name) == (agent.local_belief, agent.status, agent.name)
+    assert [agent.id for agent in state.spawners[spawner.spawner_id].spawned_agents] == \
+        [agent.id for agent in spawner.spawned_agents]
+    assert state.swarms[swarm.swarm_id].consensus_history == swarm.consensus_history
+
+
+def test_round_trip_through_compaction_and_torn_tail(tmp_path):
+    random.seed(7)
+    path = str(tmp_path / "swarm.eidoslog")
+    kernel, peer = MemeticKernel(), MemeticKernel()
+    spawner = AgentSpawner(parent_kernel=kernel)
+
+    log = EventLog(path, batch_size=16)
+    log.attach(kernel)
+    log.attach(peer)
+    log.attach(spawner)
+    for i in range(40):
+        kernel.ingest(f"idea {i}", initial_fitness=random.uniform(0.06, 1.0))
+        peer.ingest(f"peer idea {i}", initial_fitness=random.uniform(0.06, 1.0))
+    for _ in range(5):
+        kernel.evolve_step()
+
+    agents = [spawner.spawn_agent(name=f"Agent-{i}") for i in range(6)]
+    for agent, belief in zip(agents, ["alpha"] * 4 + ["beta"] * 2):
+        agent.update_belief(belief)
+    agents[0].update_status("active")
+    swarm = SwarmProtocol("test-swarm", agents)
+    log.attach(swarm)
+    assert swarm.achieve_consensus("topic") == ("alpha", True)
+
+    propagator = MemePropagator(swarm, {agents[0].id: kernel, agents[1].id: peer}, seed=1)
+    for _ in range(3):
+        propagator.propagate_round()
+    assert propagator.memes_adopted > 0 and kernel.known_origins and peer.known_origins
+
+    log.compact()
+    assert [kind for kind, _ in read_events(path)] == ["snapshot"]
+
+    # Events after compaction are appended behind the snapshot.
+    kernel.evolve_step()
+    peer.ingest("late idea", initial_fitness=0.5)
+    agents[5].update_belief("gamma")
+    swarm.achieve_consensus("second topic")
+    log.close()
+    # Closing detaches everything the log was attached to, so later changes are not logged.
+    assert all(component.event_log is None for component in [kernel, peer, spawner, swarm] + agents)
+
+    # A crash mid-write leaves a torn frame; reopening truncates it and keeps appending.
+    with open(path, "ab") as handle:
+        handle.write(b"\x40\x00\x00\x00\xde\xad\xbe\xefpartial frame")
+    log = EventLog(path)
+    log.attach(kernel) # Re-records the kernel's current state
+    kernel.ingest("after crash", initial_fitness=0.7)
+    log.close()
+
+    with open(path, "rb") as handle:
+        assert handle.read(len(MAGIC)) == MAGIC
+    state = replay(path)
+    _assert_matches(state, [kernel, peer], spawner, swarm)
+
+    # Replayed swarms are fully constructed and usable.
+    replayed_swarm = state.swarms[swarm.swarm_id]
+    replayed_swarm.send_message(agents[0].id, agents[1].id, "note", "hello")
+    assert state.agents[agents[1].id].inbox[-1]["payload"] == "hello"
+    replayed_propagator = MemePropagator(replayed_swarm, {agents[0].id: state.kernels[kernel.kernel_id],
+                                                          agents[1].id: state.kernels[peer.kernel_id]}, seed=1)
+    assert replayed_propagator.propagate_round()["memes_sent"] > 0
+
+
+def test_closed_log_detaches_components_and_refuses_events(tmp_path):
+    log = EventLog(str(tmp_path / "closed.eidoslog"), batch_size=4)
+    spawner = AgentSpawner(parent_kernel=MemeticKernel())
+    log.attach(spawner)
+    agent = spawner.spawn_agent(name="Late")
+    log.close()
+    assert log.closed and spawner.event_log is None and agent.event_log is None
+    for i in range(8): # Would have hit a commit on the closed file before
+        agent.update_belief(f"belief {i}")
+    with pytest.raises(ValueError):
+        log.emit("belief", agent.id, "after close")
+
+
+def test_commit_interval_bounds_buffered_events(tmp_path):
+    path = str(tmp_path / "interval.eidoslog")
+    kernel = MemeticKernel()
+    log = EventLog(path, batch_size=1024, commit_interval=0.0)
+    log.attach(kernel)
+    kernel.ingest("committed without close", initial_fitness=0.5)
+    assert [kind for kind, _ in read_events(path)] == ["kernel", "ingest"]
+    log.close()
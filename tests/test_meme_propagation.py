@@ -0,0 +1,30 @@
+# tests/test_meme_propagation.py
+
+import pytest
+
+from eidos.core.agent_spawner import Agent
+from eidos.core.memetic_kernel import MemeticKernel
+from eidos.protocol.meme_propagation import MemePropagator
+from eidos.protocol.swarm_protocol import SwarmProtocol
+
+
+def _kernels(agents, prefix):
+    kernels = {}
+    for agent in agents:
+        kernels[agent.id] = MemeticKernel()
+        kernels[agent.id].ingest(f"{prefix} idea from {agent.name}", initial_fitness=0.9)
+    return kernels
+
+
+def test_propagators_on_one_swarm_keep_their_own_handlers():
+    agents = [Agent(name=f"Agent-{i}") for i in range(4)]
+    swarm = SwarmProtocol("test-swarm", agents)
+    first = MemePropagator(swarm, _kernels(agents[:2], "first"), seed=0)
+    with pytest.raises(ValueError):
+        MemePropagator(swarm, _kernels(agents[2:], "second"), seed=0)
+
+    second = MemePropagator(swarm, _kernels(agents[2:], "second"), seed=0, message_type="second_batch")
+    assert first.propagate_round()["memes_adopted"] == 2
+    assert second.propagate_round()["memes_adopted"] == 2
+    for agent in agents[2:]:
+        assert all(str(meme.content).startswith("second") for meme in second.kernels[agent.id].meme_pool)
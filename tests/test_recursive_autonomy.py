@@ -0,0 +1,29 @@
+# tests/test_recursive_autonomy.py
+
+import random
+
+import pytest
+
+from eidos.core.recursive_autonomy import FleetAutonomyPipeline, RecursiveAutonomyEngine
+
+
+@pytest.mark.parametrize("state", [
+    {"performance": 0.5, "alignment": 0.95}, # Code optimization
+    {"performance": 1.2, "alignment": 0.6}, # Directive refinement
+    {"performance": 1.2, "alignment": 0.95}, # No modification
+])
+def test_fleet_pipeline_matches_engine_for_one_agent(state):
+    seed = 11
+    random.seed(seed) # The engine draws from the module RNG in the same order as the fleet kernel
+    engine = RecursiveAutonomyEngine("agent-0")
+    evaluation = engine.self_evaluate(state)
+    proposal = engine.propose_self_modification(evaluation)
+    outcome = engine.simulate_timeline_impact(proposal) if proposal["type"] != "none" else None
+
+    result = FleetAutonomyPipeline(seed=seed).run_states({"agent-0": state}).get(0)
+    assert result["proposal_type"] == proposal["type"]
+    assert result["performance_score"] == evaluation["performance_score"]
+    if outcome is not None:
+        assert result["predicted_long_term_performance_gain"] == outcome["predicted_long_term_performance_gain"]
+        assert result["predicted_alignment_stability"] == outcome["predicted_alignment_stability"]
+        assert result["risk_of_unforeseen_consequences"] == outcome["risk_of_unforeseen_consequences"]
@@ -0,0 +1,25 @@
+# tests/test_semantic_index.py
+
+from eidos.core.memetic_kernel import MemeUnit
+from eidos.core.semantic_index import HashingVectorizer, SemanticMemeIndex
+
+
+def test_non_latin_content_is_tokenized():
+    vectorizer = HashingVectorizer()
+    assert any(vectorizer.embed("погода в Москве"))
+    assert list(vectorizer.embed("café")) != list(vectorizer.embed("caf"))
+
+    index = SemanticMemeIndex()
+    memes = [MemeUnit("погода в Москве"), MemeUnit("東京の天気"), MemeUnit("plain idea")]
+    for meme in memes:
+        index.add(meme)
+    assert index.search("Москве")[0][1] is memes[0]
+
+
+def test_featureless_query_falls_back_to_fitness():
+    index = SemanticMemeIndex()
+    memes = [MemeUnit(f"idea {i}", initial_fitness=fitness) for i, fitness in enumerate((0.2, 0.9, 0.5))]
+    for meme in memes:
+        index.add(meme)
+    assert [meme for _, meme in index.search("?!", count=2)] == [memes[1], memes[2]]
+    assert [meme for _, meme in index.exact_search("", count=1)] == [memes[1]]
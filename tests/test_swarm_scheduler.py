@@ -0,0 +1,24 @@
+# tests/test_swarm_scheduler.py
+
+import pytest
+
+from eidos.protocol.swarm_scheduler import SwarmScheduler
+
+
+def test_repeating_callbacks_need_a_positive_interval():
+    scheduler = SwarmScheduler(clock=lambda: 0.0)
+    for interval in (0, -1.0):
+        with pytest.raises(ValueError):
+            scheduler.schedule(0, lambda: None, interval=interval)
+    assert scheduler.tick()["deadlines"] == 0
+
+
+def test_repeating_callback_runs_once_per_tick():
+    now = [0.0]
+    scheduler = SwarmScheduler(clock=lambda: now[0])
+    calls = []
+    scheduler.schedule(0, calls.append, "run", interval=1.0)
+    now[0] = 5.0 # Missed periods are skipped, not run back to back
+    assert scheduler.tick()["deadlines"] == 1
+    assert scheduler.tick(now=6.0)["deadlines"] == 1
+    assert calls == ["run", "run"]